@@ -1,28 +1,128 @@
 """
-This module provides example implementations for static and dynamic arrays. Since Python
-already contains a dynamic array primitive (i.e., `list`), the below code should
-only be used for learning purposes.
+This module provides example implementations for static, dynamic, tiered and
+sorted arrays. Since Python already contains a dynamic array primitive (i.e., `list`),
+the below code should only be used for learning purposes.
 """
 
+from __future__ import annotations
+
+import mmap
+import os
+from array import array as typed_array
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; searches fall back to Python loops.
+    np = None
+
+# Typecodes whose memory layout NumPy can interpret directly.
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+
 
 class StaticArray:
     """
     Fixed length container containing n elements indexable
     from range [0, n-1].
+
+    By default elements are stored as Python objects. When a `typecode`
+    (see the `array` module) is provided, elements are stored unboxed in
+    contiguous memory, which can be shared without copying through
+    `as_memoryview`. Typed arrays can also be backed by a memory-mapped
+    file (see `StaticArray.open`).
+
+    On Python 3.12+ typed arrays also export the buffer protocol directly
+    (e.g., `memoryview(arr)`). Older versions ignore `__buffer__`, and
+    `np.asarray(arr)` silently copies element by element, so pass
+    `arr.as_memoryview()` instead to share memory there.
     """
 
-    def __init__(self, length: int) -> None:
+    def __init__(self, length: int, typecode: str | None = None) -> None:
         """
         Instantiate a static array of the specified `length`.
+        Elements of a typed array are initialized to zero.
         """
 
         if length <= 0:
             raise ValueError("length must be greater than zero")
 
-        self.array: list = [None] * length
+        self.typecode: str | None = typecode
+        self.array: list | typed_array | memoryview
+        if typecode is None:
+            self.array = [None] * length
+            self.default: Any = None
+        else:
+            empty = typed_array(typecode)
+            self.array = typed_array(typecode, bytes(empty.itemsize * length))
+            self.default = self.array[0]
         self.length: int = length
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def open(
+        cls,
+        path: str | os.PathLike,
+        length: int | None = None,
+        typecode: str = "q",
+        readonly: bool = False,
+    ) -> StaticArray:
+        """
+        Instantiate a typed static array backed by the file at `path`.
+
+        The file is memory-mapped, so elements are read and written directly
+        in the page cache and processes opening the same file share a single
+        copy. If `length` is omitted it is inferred from the file size.
+        Writable files shorter than `length` elements are extended with zeros.
+        """
+        itemsize = typed_array(typecode).itemsize
+        if readonly:
+            mode, access = "rb", mmap.ACCESS_READ
+        elif os.path.exists(path):
+            mode, access = "r+b", mmap.ACCESS_WRITE
+        else:
+            mode, access = "w+b", mmap.ACCESS_WRITE
+
+        with open(path, mode) as file:
+            file_size = os.fstat(file.fileno()).st_size
+            if length is None:
+                length = file_size // itemsize
+            if length <= 0:
+                raise ValueError("length must be greater than zero")
+            nbytes = length * itemsize
+            if file_size < nbytes:
+                if readonly:
+                    raise ValueError("file is smaller than the requested length")
+                file.truncate(nbytes)
+            mapping = mmap.mmap(file.fileno(), nbytes, access=access)
+
+        array = cls.__new__(cls)
+        array.typecode = typecode
+        array.array = memoryview(mapping).cast(typecode)
+        array.default = typed_array(typecode, bytes(itemsize))[0]
+        array.length = length
+        array._mmap = mapping
+        return array
+
+    def flush(self) -> None:
+        """
+        Write changes of a file-backed array to disk.
+        Does nothing for in-memory arrays.
+        """
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flush and unmap a file-backed array. Views returned by
+        `as_memoryview` must be released first.
+        Does nothing for in-memory arrays.
+        """
+        if self._mmap is not None:
+            if not self._mmap.closed and not self.array.readonly:
+                self._mmap.flush()
+            self.array.release()
+            self._mmap.close()
 
     def size(self) -> int:
         """
@@ -32,10 +132,11 @@ class StaticArray:
 
     def clear(self) -> None:
         """
-        Replaces all elements of the array with `None` values.
+        Replaces all elements of the array with `None` values
+        (zero for typed arrays).
         """
         for i in range(self.length):
-            self.array[i] = None
+            self.array[i] = self.default
 
     def get(self, index: int) -> Any:
         """
@@ -55,94 +156,826 @@ class StaticArray:
         else:
             raise IndexError
 
+    def __len__(self) -> int:
+        return self.size()
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(self.size()):
+            yield self.get(i)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """
+        Return the element at `index`, or a view over the
+        elements selected by a slice.
+        """
+        if isinstance(index, slice):
+            return ArrayView.from_slice(self, index)
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self.set(index, value)
+
+    def _range(self, start: int, stop: int | None) -> tuple[int, int]:
+        if stop is None:
+            stop = self.length
+        if not (0 <= start <= stop <= self.length):
+            raise IndexError
+        return start, stop
+
+    def _matches(self, value: Any, start: int, stop: int) -> Any:
+        """
+        Returns a NumPy boolean mask of the elements in [start, stop) equal to
+        `value`, or None if the search cannot be vectorized.
+        """
+        if np is None or self.typecode is None:
+            return None
+        if self.typecode not in NUMERIC_TYPECODES:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        try:
+            # NumPy casts `value` to the array's dtype before comparing, so
+            # only vectorize values the dtype represents exactly (e.g., not
+            # 0.1 in a float32 array) to give the same results as the loop.
+            if np.dtype(self.typecode).type(value).item() != value:
+                return None
+            return np.frombuffer(self.array, dtype=self.typecode)[start:stop] == value
+        except (OverflowError, TypeError, ValueError):
+            return None
+
     def contains(self, value: Any) -> bool:
         """
         Returns true if the array contains the specified `value`.
         """
+        matches = self._matches(value, 0, self.length)
+        if matches is not None:
+            return bool(matches.any())
         for i in range(self.length):
             if self.array[i] == value:
                 return True
         return False
 
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """
+        Returns the index of the first occurrence of `value` within
+        [start, stop). Raises a ValueError if `value` is not found.
+        """
+        start, stop = self._range(start, stop)
+        matches = self._matches(value, start, stop)
+        if matches is not None:
+            indices = np.flatnonzero(matches)
+            if len(indices):
+                return start + int(indices[0])
+        else:
+            for i in range(start, stop):
+                if self.array[i] == value:
+                    return i
+        raise ValueError(f"{value!r} is not in the array")
+
+    def count(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """
+        Returns the number of occurrences of `value` within [start, stop).
+        """
+        start, stop = self._range(start, stop)
+        matches = self._matches(value, start, stop)
+        if matches is not None:
+            return int(np.count_nonzero(matches))
+        return sum(1 for i in range(start, stop) if self.array[i] == value)
+
+    def find_all(
+        self, value: Any, start: int = 0, stop: int | None = None
+    ) -> list[int]:
+        """
+        Returns the indices of all occurrences of `value` within [start, stop).
+        """
+        start, stop = self._range(start, stop)
+        matches = self._matches(value, start, stop)
+        if matches is not None:
+            return (np.flatnonzero(matches) + start).tolist()
+        return [i for i in range(start, stop) if self.array[i] == value]
+
+    def as_memoryview(self, start: int = 0, stop: int | None = None) -> memoryview:
+        """
+        Returns a `memoryview` over elements [start, stop) of a typed array.
+        The view shares memory with the array; no elements are copied.
+        """
+        if self.typecode is None:
+            raise TypeError("only typed arrays support the buffer protocol")
+        return memoryview(self.array)[start:stop]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.as_memoryview()
+
 
 class DynamicArray:
     """
     A dynamic length container containing n elements indexable
     from range [0, n-1].
+
+    Elements are kept in a backing `StaticArray` whose capacity is larger
+    than or equal to the number of elements. When the backing array is full
+    its capacity is multiplied by `growth_factor`, so appending runs in
+    amortized constant time.
+
+    The backing array is used as a circular buffer: element 0 is stored at
+    a movable head offset, so inserting or removing elements at either end
+    also runs in amortized constant time.
     """
 
-    def __init__(self, length: int) -> None:
+    def __init__(
+        self,
+        length: int = 0,
+        growth_factor: float = 2.0,
+        typecode: str | None = None,
+    ) -> None:
         """
         Instantiate a dynamic array of the specified `length`.
+        Optionally store elements unboxed using an `array` module `typecode`.
+        """
+        if length < 0:
+            raise ValueError("length must be greater than or equal to zero")
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than one")
+
+        self.array = StaticArray(max(length, 1), typecode)
+        self.length: int = length
+        self.growth_factor: float = growth_factor
+        self._head: int = 0
+
+    @property
+    def typecode(self) -> str | None:
+        """
+        The `array` module typecode of the elements, or None for objects.
+        """
+        return self.array.typecode
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of elements the array can hold before reallocating.
         """
-        self.array = StaticArray(length)
+        return self.array.size()
+
+    def _index(self, index: int) -> int:
+        """Returns the position in the backing array of element `index`."""
+        return (self._head + index) % self.array.length
+
+    def _resize(self, capacity: int) -> None:
+        array = StaticArray(capacity, self.array.typecode)
+        for i in range(self.length):
+            array.set(i, self.array.get(self._index(i)))
+        self.array = array
+        self._head = 0
+
+    def _grow(self, minimum: int) -> None:
+        capacity = int(self.capacity * self.growth_factor)
+        self._resize(max(capacity, minimum))
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Ensure the array can hold at least `capacity` elements
+        without reallocating.
+        """
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Reduce the capacity of the array to match its length.
+        """
+        capacity = max(self.length, 1)
+        if capacity < self.capacity:
+            self._resize(capacity)
 
     def size(self) -> int:
         """
         Returns the length of the array.
         """
-        return self.array.size()
+        return self.length
 
     def clear(self) -> None:
         """
-        Replaces all elements of the array with `None` values.
+        Replaces all elements of the array with `None` values
+        (zero for typed arrays).
         """
-        self.array.clear()
+        for i in range(self.length):
+            self.array.set(self._index(i), self.array.default)
 
     def get(self, index: int) -> Any:
         """
         Return the element in the array at the specified `index`.
         """
-        return self.array.get(index)
+        if 0 <= index < self.length:
+            return self.array.get(self._index(index))
+        else:
+            raise IndexError
 
     def set(self, index: int, value: Any) -> None:
         """
         Set the element in the array at the specified `index`.
         """
-        self.array.set(index, value)
+        if 0 <= index < self.length:
+            self.array.set(self._index(index), value)
+        else:
+            raise IndexError
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(self.size()):
+            yield self.get(i)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """
+        Return the element at `index`, or a view over the
+        elements selected by a slice.
+        """
+        if isinstance(index, slice):
+            return ArrayView.from_slice(self, index)
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self.set(index, value)
+
+    def _segments(
+        self, start: int, stop: int | None
+    ) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields (index, physical start, physical stop) for each contiguous run
+        of the backing array holding elements [start, stop), where `index` is
+        the logical index of the first element of the run.
+        """
+        if stop is None:
+            stop = self.length
+        if not (0 <= start <= stop <= self.length):
+            raise IndexError
+        if start == stop:
+            return
+        first = self._index(start)
+        last = first + (stop - start)
+        if last <= self.capacity:
+            yield start, first, last
+        else:
+            yield start, first, self.capacity
+            yield start + self.capacity - first, 0, last - self.capacity
 
     def contains(self, value: Any) -> bool:
         """
         Returns true if the array contains the specified `value`.
         """
-        return self.array.contains(value)
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
 
-    def insert(self, value: Any) -> None:
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
         """
-        Inserts a new value at the beginning of the array.
-        All other elements are shifted.
+        Returns the index of the first occurrence of `value` within
+        [start, stop). Raises a ValueError if `value` is not found.
         """
-        new_length = self.array.size() + 1
-        array = StaticArray(new_length)
-        array.set(0, value)
-        for i in range(self.array.size()):
-            array.set(i + 1, self.array.get(i))
-        self.array = array
+        for index, first, last in self._segments(start, stop):
+            try:
+                return index + self.array.index(value, first, last) - first
+            except ValueError:
+                pass
+        raise ValueError(f"{value!r} is not in the array")
+
+    def count(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """
+        Returns the number of occurrences of `value` within [start, stop).
+        """
+        return sum(
+            self.array.count(value, first, last)
+            for _, first, last in self._segments(start, stop)
+        )
+
+    def find_all(
+        self, value: Any, start: int = 0, stop: int | None = None
+    ) -> list[int]:
+        """
+        Returns the indices of all occurrences of `value` within [start, stop).
+        """
+        indices = []
+        for index, first, last in self._segments(start, stop):
+            for i in self.array.find_all(value, first, last):
+                indices.append(index + i - first)
+        return indices
+
+    def insert(self, value: Any, index: int = 0) -> None:
+        """
+        Inserts a new value at the specified `index` (by default, the
+        beginning of the array). The elements on the shorter side of
+        `index` are shifted, so inserting at either end runs in
+        amortized constant time.
+        """
+        self.insert_many(index, (value,))
+
+    def insert_many(self, index: int, values: Iterable[Any]) -> None:
+        """
+        Inserts all `values` starting at the specified `index`.
+        The elements on the shorter side of `index` are shifted once,
+        regardless of the number of inserted values.
+        """
+        if not (0 <= index <= self.length):
+            raise IndexError
+        values = list(values)
+        k = len(values)
+        length = self.length + k
+
+        if length > self.capacity:
+            # Copy into the new backing array with the gap already in place.
+            capacity = max(int(self.capacity * self.growth_factor), length)
+            array = StaticArray(capacity, self.array.typecode)
+            for i in range(self.length):
+                j = i if i < index else i + k
+                array.set(j, self.array.get(self._index(i)))
+            self.array = array
+            self._head = 0
+        elif index < self.length - index:
+            # Move the head back and shift the leading elements forwards.
+            self._head = (self._head - k) % self.capacity
+            for i in range(index):
+                self.array.set(self._index(i), self.array.get(self._index(i + k)))
+        else:
+            for i in range(self.length - 1, index - 1, -1):
+                self.array.set(self._index(i + k), self.array.get(self._index(i)))
+        for i, value in enumerate(values):
+            self.array.set(self._index(index + i), value)
+
+        self.length = length
 
     def append(self, value: Any) -> None:
         """
         Inserts a new value at the end of the array.
-        All other elements are shifted.
+        The backing array is only reallocated when it is full.
         """
-        new_length = self.array.size() + 1
-        array = StaticArray(new_length)
-        for i in range(self.array.size()):
-            array.set(i, self.array.get(i))
-        array.set(new_length - 1, value)
-        self.array = array
+        if self.length == self.capacity:
+            self._grow(self.length + 1)
+        self.array.set(self._index(self.length), value)
+        self.length += 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """
+        Inserts all `values` at the end of the array.
+        """
+        self.insert_many(self.length, values)
 
     def delete(self, index: int) -> None:
         """
         Removes the element at the specified `index`.
-        All other elements are shifted.
-        """
-        new_length = self.array.size() - 1
-        array = StaticArray(new_length)
-        for i in range(self.array.size()):
-            if i < index:
-                array.set(i, self.array.get(i))
-            elif i == index:
-                pass
-            elif i > index:
-                array.set(i - 1, self.array.get(i))
-        self.array = array
+        The elements on the shorter side of `index` are shifted, so
+        removing the first or last element runs in constant time.
+        """
+        if not (0 <= index < self.length):
+            raise IndexError
+        self.delete_range(index, index + 1)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        """
+        Removes the elements in the range [start, stop).
+        The elements on the shorter side of the range are shifted once,
+        regardless of the number of removed elements.
+        """
+        if not (0 <= start <= stop <= self.length):
+            raise IndexError
+        k = stop - start
+        if start < self.length - stop:
+            # Shift the leading elements backwards and move the head forward.
+            for i in range(start - 1, -1, -1):
+                self.array.set(self._index(i + k), self.array.get(self._index(i)))
+            for i in range(k):
+                self.array.set(self._index(i), self.array.default)
+            self._head = self._index(k)
+        else:
+            for i in range(stop, self.length):
+                self.array.set(self._index(i - k), self.array.get(self._index(i)))
+            for i in range(self.length - k, self.length):
+                self.array.set(self._index(i), self.array.default)
+        self.length -= k
+
+
+class TieredArray:
+    """
+    A dynamic length container containing n elements indexable
+    from range [0, n-1], stored as a tiered vector.
+
+    Elements live in blocks of `block_size` elements, each a circular
+    `DynamicArray`. Every block except the last is full, so element i is
+    found in block i // block_size in constant time. Inserting or deleting
+    shifts elements within one block and then moves a single element
+    between each of the following blocks, which costs O(√n) when the
+    block size is about √n.
+    """
+
+    def __init__(
+        self,
+        length: int = 0,
+        block_size: int | None = None,
+        typecode: str | None = None,
+    ) -> None:
+        """
+        Instantiate a tiered array of the specified `length`.
+
+        If `block_size` is omitted it is adjusted as the array grows
+        and shrinks to stay close to √n.
+        """
+        if length < 0:
+            raise ValueError("length must be greater than or equal to zero")
+        if block_size is not None and block_size <= 0:
+            raise ValueError("block_size must be greater than zero")
+
+        self.typecode: str | None = typecode
+        self.block_size: int = block_size or 16
+        self.blocks: DynamicArray = DynamicArray()
+        self.length: int = 0
+        self._adaptive: bool = block_size is None
+
+        default = StaticArray(1, typecode).default
+        for _ in range(length):
+            self.append(default)
+
+    def _block(self) -> DynamicArray:
+        block = DynamicArray(typecode=self.typecode)
+        block.reserve(self.block_size)
+        return block
+
+    def _rebuild(self, block_size: int) -> None:
+        """Redistribute all elements into blocks of `block_size` elements."""
+        values = iter(self)
+        self.block_size = block_size
+        blocks = DynamicArray()
+        for value in values:
+            if blocks.size() == 0 or blocks.get(blocks.size() - 1).size() == block_size:
+                blocks.append(self._block())
+            blocks.get(blocks.size() - 1).append(value)
+        self.blocks = blocks
+
+    def _fit(self) -> None:
+        """Keep the block size close to √n when it is adaptive."""
+        if not self._adaptive:
+            return
+        b = self.block_size
+        if self.length > b * b:
+            self._rebuild(b * 2)
+        elif b > 16 and self.length < b * b // 16:
+            self._rebuild(b // 2)
+
+    def size(self) -> int:
+        """
+        Returns the length of the array.
+        """
+        return self.length
+
+    def clear(self) -> None:
+        """
+        Replaces all elements of the array with `None` values
+        (zero for typed arrays).
+        """
+        for block in self.blocks:
+            block.clear()
+
+    def get(self, index: int) -> Any:
+        """
+        Return the element in the array at the specified `index`.
+        """
+        if 0 <= index < self.length:
+            b = self.block_size
+            return self.blocks.get(index // b).get(index % b)
+        else:
+            raise IndexError
+
+    def set(self, index: int, value: Any) -> None:
+        """
+        Set the element in the array at the specified `index`.
+        """
+        if 0 <= index < self.length:
+            b = self.block_size
+            self.blocks.get(index // b).set(index % b, value)
+        else:
+            raise IndexError
+
+    def contains(self, value: Any) -> bool:
+        """
+        Returns true if the array contains the specified `value`.
+        """
+        for block in self.blocks:
+            if block.contains(value):
+                return True
+        return False
+
+    def insert(self, value: Any, index: int = 0) -> None:
+        """
+        Inserts a new value at the specified `index` (by default, the
+        beginning of the array).
+        """
+        if not (0 <= index <= self.length):
+            raise IndexError
+        b = self.block_size
+        blocks = self.blocks
+        last = blocks.size() - 1
+        if last < 0 or blocks.get(last).size() == b:
+            blocks.append(self._block())
+            last += 1
+
+        # Make room in block k by moving the last element of each
+        # following full block to the front of its successor.
+        k = index // b
+        for j in range(last, k, -1):
+            previous = blocks.get(j - 1)
+            blocks.get(j).insert(previous.get(b - 1))
+            previous.delete(b - 1)
+        blocks.get(k).insert(value, index - k * b)
+
+        self.length += 1
+        self._fit()
+
+    def append(self, value: Any) -> None:
+        """
+        Inserts a new value at the end of the array.
+        """
+        self.insert(value, self.length)
+
+    def delete(self, index: int) -> None:
+        """
+        Removes the element at the specified `index`.
+        """
+        if not (0 <= index < self.length):
+            raise IndexError
+        b = self.block_size
+        blocks = self.blocks
+        k = index // b
+        blocks.get(k).delete(index - k * b)
+
+        # Refill block k by moving the first element of each following
+        # block to the end of its predecessor.
+        for j in range(k + 1, blocks.size()):
+            block = blocks.get(j)
+            blocks.get(j - 1).append(block.get(0))
+            block.delete(0)
+        last = blocks.size() - 1
+        if blocks.get(last).size() == 0:
+            blocks.delete(last)
+
+        self.length -= 1
+        self._fit()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Any]:
+        for block in self.blocks:
+            yield from block
+
+
+class ArrayView:
+    """
+    A window over the elements start, start + step, ... of a parent
+    `StaticArray` or `DynamicArray`. Views are returned by slicing
+    (e.g., `array[2:10:2]`) and read and write the parent directly;
+    elements are only copied by `copy`.
+
+    Views index the parent by position, so a view over a `DynamicArray`
+    observes later changes to that array, including shifts.
+    """
+
+    def __init__(
+        self,
+        parent: StaticArray | DynamicArray,
+        start: int,
+        length: int,
+        step: int = 1,
+    ) -> None:
+        """
+        Instantiate a view over `length` elements of `parent`,
+        beginning at `start` and separated by `step`.
+        """
+        if step == 0:
+            raise ValueError("step must not be zero")
+        if length < 0:
+            raise ValueError("length must be greater than or equal to zero")
+        last = start + (length - 1) * step
+        if length and not (0 <= start < parent.size() and 0 <= last < parent.size()):
+            raise IndexError
+        self.parent = parent
+        self.start = start
+        self.length = length
+        self.step = step
+
+    @classmethod
+    def from_slice(
+        cls, parent: StaticArray | DynamicArray | ArrayView, index: slice
+    ) -> ArrayView:
+        """
+        Instantiate a view over the elements of `parent` selected by `index`.
+        Views of views reference the original parent.
+        """
+        start, stop, step = index.indices(parent.size())
+        length = len(range(start, stop, step))
+        if isinstance(parent, ArrayView):
+            start = parent.start + start * parent.step
+            step = parent.step * step
+            parent = parent.parent
+        return cls(parent, start, length, step)
+
+    def _index(self, index: int) -> int:
+        """Returns the position in the parent of element `index`."""
+        if 0 <= index < self.length:
+            return self.start + index * self.step
+        else:
+            raise IndexError
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the view.
+        """
+        return self.length
+
+    def get(self, index: int) -> Any:
+        """
+        Return the element in the view at the specified `index`.
+        """
+        return self.parent.get(self._index(index))
+
+    def set(self, index: int, value: Any) -> None:
+        """
+        Set the element in the view at the specified `index`.
+        """
+        self.parent.set(self._index(index), value)
+
+    def contains(self, value: Any) -> bool:
+        """
+        Returns true if the view contains the specified `value`.
+        """
+        if self.length and abs(self.step) == 1:
+            # Contiguous views reuse the parent's search.
+            last = self.start + (self.length - 1) * self.step
+            lo, hi = min(self.start, last), max(self.start, last)
+            try:
+                self.parent.index(value, lo, hi + 1)
+            except ValueError:
+                return False
+            return True
+        for i in range(self.length):
+            if self.get(i) == value:
+                return True
+        return False
+
+    def copy(self) -> DynamicArray:
+        """
+        Returns a new array containing the elements of the view.
+        """
+        array = DynamicArray(typecode=self.parent.typecode)
+        array.reserve(self.length)
+        array.extend(self)
+        return array
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(self.size()):
+            yield self.get(i)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """
+        Return the element at `index`, or a view over the
+        elements selected by a slice.
+        """
+        if isinstance(index, slice):
+            return ArrayView.from_slice(self, index)
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self.set(index, value)
+
+
+class SortedArray:
+    """
+    A dynamic array whose elements are kept in ascending order without
+    duplicates. Lookups use binary search and run in O(log n), making it
+    a compact alternative to a binary search tree for read-heavy sets.
+    """
+
+    def __init__(
+        self, values: Iterable[Any] = (), typecode: str | None = None
+    ) -> None:
+        """
+        Instantiate a sorted array containing the distinct `values`.
+        Optionally store elements unboxed using an `array` module `typecode`.
+        """
+        self.array = DynamicArray(typecode=typecode)
+        self.merge(sorted(values))
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the array.
+        """
+        return self.array.size()
+
+    def get(self, index: int) -> Any:
+        """
+        Return the element in the array at the specified `index`.
+        """
+        return self.array.get(index)
+
+    def _bisect_left(self, value: Any) -> int:
+        """Returns the index of the first element not less than `value`."""
+        lo, hi = 0, self.array.size()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.array.get(mid) < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisect_right(self, value: Any) -> int:
+        """Returns the index of the first element greater than `value`."""
+        lo, hi = 0, self.array.size()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if value < self.array.get(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def contains(self, value: Any) -> bool:
+        """
+        Returns true if the array contains the specified `value`.
+        """
+        i = self._bisect_left(value)
+        return i < self.array.size() and self.array.get(i) == value
+
+    def index(self, value: Any) -> int:
+        """
+        Returns the index of `value`. Raises a ValueError if `value`
+        is not found.
+        """
+        i = self._bisect_left(value)
+        if i < self.array.size() and self.array.get(i) == value:
+            return i
+        raise ValueError(f"{value!r} is not in the array")
+
+    def rank(self, value: Any) -> int:
+        """
+        Returns the number of elements less than `value`.
+        """
+        return self._bisect_left(value)
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """
+        Returns the number of elements in the range [lo, hi].
+        """
+        return max(0, self._bisect_right(hi) - self._bisect_left(lo))
+
+    def insert(self, value: Any) -> None:
+        """
+        Inserts `value` at its sorted position.
+        Values already in the array are ignored.
+        """
+        i = self._bisect_left(value)
+        if i == self.array.size() or self.array.get(i) != value:
+            self.array.insert_many(i, (value,))
+
+    def delete(self, value: Any) -> None:
+        """
+        Removes `value` from the array.
+        Values not in the array are ignored.
+        """
+        i = self._bisect_left(value)
+        if i < self.array.size() and self.array.get(i) == value:
+            self.array.delete(i)
+
+    def merge(self, values: Iterable[Any]) -> None:
+        """
+        Inserts all elements of the sorted iterable `values` using a single
+        linear pass over both sequences. Raises a ValueError if `values`
+        is not sorted, leaving the array unchanged.
+        """
+        merged = DynamicArray(
+            growth_factor=self.array.growth_factor,
+            typecode=self.array.array.typecode,
+        )
+        merged.reserve(self.array.size())
+
+        def push(value: Any) -> None:
+            if merged.size() == 0 or merged.get(merged.size() - 1) != value:
+                merged.append(value)
+
+        i, n = 0, self.array.size()
+        for k, value in enumerate(values):
+            if k > 0 and value < previous:
+                raise ValueError("values must be sorted")
+            previous = value
+            while i < n and self.array.get(i) < value:
+                push(self.array.get(i))
+                i += 1
+            push(value)
+        while i < n:
+            push(self.array.get(i))
+            i += 1
+
+        self.array = merged
@@ -1,8 +1,11 @@
 """
-This module provides an implementation for a binary search tree.
+This module provides an implementation for a binary search tree,
+a self-balancing AVL tree and a persistent AVL tree.
 """
 
 from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from heapq import merge
 from typing import Any
 
 
@@ -11,11 +14,28 @@ class Node:
         self.key: Any = key
         self.left: Node | None = None
         self.right: Node | None = None
+        self.height: int = 1
+        self.size: int = 1
 
     def __repr__(self) -> str:
         return f"<Node(key={self.key})>"
 
 
+def height(node: Node | None) -> int:
+    """
+    Returns the height of the subtree rooted at `node`.
+    Empty subtrees have a height of zero.
+    """
+    return node.height if node is not None else 0
+
+
+def size(node: Node | None) -> int:
+    """
+    Returns the number of nodes in the subtree rooted at `node`.
+    """
+    return node.size if node is not None else 0
+
+
 class BinarySearchTree:
     def __init__(self) -> None:
         self._root: Node | None = None
@@ -27,122 +47,455 @@ class BinarySearchTree:
         """
         return self._root
 
-    def _insert(self, node: Node | None, key: Any) -> Node | None:
-        if node is None:
-            return Node(key)
-        if key == node.key:
-            return node
-        elif key < node.key:
-            node.left = self._insert(node.left, key)
-        elif key > node.key:
-            node.right = self._insert(node.right, key)
+    @property
+    def height(self) -> int:
+        """
+        The number of nodes on the longest path from the root to a leaf.
+        """
+        return height(self._root)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of nodes in the BST.
+        """
+        return size(self._root)
+
+    def _update(self, node: Node) -> None:
+        """Recompute the attributes of `node` derived from its children."""
+        node.height = 1 + max(height(node.left), height(node.right))
+        node.size = 1 + size(node.left) + size(node.right)
+
+    def _rebalance(self, node: Node) -> Node:
+        """
+        Called for every node on the path of an insert or delete, from the
+        bottom up. Returns the root of the (possibly restructured) subtree.
+        """
+        self._update(node)
         return node
 
-    def insert(self, key: Any) -> None:
+    def _copy(self, node: Node) -> Node:
         """
-        Insert a node with the specified key.
+        Called before a node is modified. Returns the node to modify in its
+        place, which is the node itself unless the tree is persistent.
         """
-        self._root = self._insert(self._root, key)
+        return node
 
-    def _search(self, node: Node | None, key: Any) -> Node | None:
-        if node is None:
+    @classmethod
+    def from_sorted(cls, keys: Iterable[Any]) -> BinarySearchTree:
+        """
+        Build a perfectly balanced tree from an iterable of sorted keys
+        in O(n). Duplicated keys are removed.
+        """
+        tree = cls()
+        tree._root = tree._build(cls._distinct(keys))
+        return tree
+
+    @staticmethod
+    def _distinct(keys: Iterable[Any]) -> list[Any]:
+        lst: list[Any] = []
+        for key in keys:
+            if lst and key == lst[-1]:
+                continue
+            if lst and key < lst[-1]:
+                raise ValueError("keys must be sorted")
+            lst.append(key)
+        return lst
+
+    def _build(
+        self, keys: list[Any], lo: int = 0, hi: int | None = None
+    ) -> Node | None:
+        """Build a balanced subtree from keys[lo:hi], which must be sorted."""
+        if hi is None:
+            hi = len(keys)
+        if lo >= hi:
             return None
-        elif node.key == key:
-            return node
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        # Recursion depth is bounded by log2(n).
+        mid = (lo + hi) // 2
+        node = Node(keys[mid])
+        node.left = self._build(keys, lo, mid)
+        node.right = self._build(keys, mid + 1, hi)
+        self._update(node)
+        return node
+
+    def merge(self, other: BinarySearchTree) -> None:
+        """
+        Insert all keys of `other` by merging the in-order key streams of both
+        trees and rebuilding a balanced tree in O(n + m).
+        """
+        keys = self._distinct(merge(self.iter_inorder(), other.iter_inorder()))
+        self._root = self._build(keys)
+
+    def _retrace(self, path: list[tuple[Node, bool]], child: Node | None) -> None:
+        """
+        Attach `child` below the last node of `path`, then rebalance each
+        node of `path` from the bottom up. Each entry of `path` holds a node
+        and whether the path continues to its left child.
+        """
+        for node, left in reversed(path):
+            node = self._copy(node)
+            if left:
+                node.left = child
+            else:
+                node.right = child
+            child = self._rebalance(node)
+        self._root = child
+
+    def insert(self, key: Any) -> None:
+        """
+        Insert a node with the specified key.
+        """
+        path: list[tuple[Node, bool]] = []
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return
+            left = key < node.key
+            path.append((node, left))
+            node = node.left if left else node.right
+        self._retrace(path, Node(key))
 
     def search(self, key: Any) -> Node | None:
         """
         Search for a node with the specified key.
         Returns None if the node does not exist.
         """
-        return self._search(self._root, key)
-
-    def _successor(self, node: Node) -> Node:
-        """Returned successor is the smallest of the larger keys."""
-        # _successor only called with node has left & right children.
-        # The returned node is always a leaf.
-        assert node.right is not None
-        node = node.right
-        while node is not None and node.left is not None:
-            node = node.left
+        node = self._root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
         return node
 
-    def _delete(self, node: Node | None, key: Any) -> Node | None:
+    def delete(self, key: Any) -> None:
+        """
+        Remove a node with the specified key.
+        """
+        path: list[tuple[Node, bool]] = []
+        node = self._root
+        while node is not None and node.key != key:
+            left = key < node.key
+            path.append((node, left))
+            node = node.left if left else node.right
+
         # key not in BST
         if node is None:
-            return None
+            return
 
-        if node.key > key:
-            node.left = self._delete(node.left, key)
-        elif node.key < key:
-            node.right = self._delete(node.right, key)
+        if node.left is None:
+            child = node.right
+        elif node.right is None:
+            child = node.left
         else:
-            # Found key in BST. Skip
-            # over the node to delete
-            if node.left is None:
-                return node.right
-            if node.right is None:
-                return node.left
-            successor = self._successor(node)
+            # Replace the key with its successor (the smallest of the
+            # larger keys), then unlink the successor's node, which
+            # never has a left child.
+            node = self._copy(node)
+            path.append((node, False))
+            successor = node.right
+            while successor.left is not None:
+                path.append((successor, True))
+                successor = successor.left
             node.key = successor.key
-            node.right = self._delete(node.right, successor.key)
+            child = successor.right
+        self._retrace(path, child)
 
-        return node
+    def _rank(self, key: Any, inclusive: bool) -> int:
+        """Count the keys less than (or equal to, if `inclusive`) `key`."""
+        rank = 0
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                rank += size(node.left) + 1
+                node = node.right
+            else:
+                return rank + size(node.left) + (1 if inclusive else 0)
+        return rank
 
-    def delete(self, key: Any) -> None:
+    def rank(self, key: Any) -> int:
         """
-        Remove a node with the specified key.
+        Returns the number of keys less than `key`.
+        """
+        return self._rank(key, inclusive=False)
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest key, counting from zero.
+        """
+        if not (0 <= k < self.size):
+            raise IndexError("k is out of bounds")
+        node = self._root
+        while node is not None:
+            left = size(node.left)
+            if k < left:
+                node = node.left
+            elif k > left:
+                k -= left + 1
+                node = node.right
+            else:
+                return node.key
+        raise AssertionError("subtree sizes are inconsistent")
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """
+        Returns the number of keys in the range [lo, hi].
         """
-        self._delete(self._root, key)
+        return max(0, self._rank(hi, inclusive=True) - self._rank(lo, inclusive=False))
 
-    def _preorder(self, node: Node | None, lst: list[Any]) -> None:
+    def min(self) -> Any:
+        """
+        Returns the smallest key, or None if the BST is empty.
+        """
+        node = self._root
         if node is None:
-            return
-        lst.append(node.key)
-        self._preorder(node.left, lst)
-        self._preorder(node.right, lst)
+            return None
+        while node.left is not None:
+            node = node.left
+        return node.key
+
+    def max(self) -> Any:
+        """
+        Returns the largest key, or None if the BST is empty.
+        """
+        node = self._root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.key
+
+    def _lower(self, key: Any, inclusive: bool) -> Any:
+        """Returns the largest key less than (or equal to) `key`."""
+        result = None
+        node = self._root
+        while node is not None:
+            if node.key < key or (inclusive and node.key == key):
+                result = node.key
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def _upper(self, key: Any, inclusive: bool) -> Any:
+        """Returns the smallest key greater than (or equal to) `key`."""
+        result = None
+        node = self._root
+        while node is not None:
+            if node.key > key or (inclusive and node.key == key):
+                result = node.key
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def floor(self, key: Any) -> Any:
+        """
+        Returns the largest key less than or equal to `key`.
+        Returns None if no such key exists.
+        """
+        return self._lower(key, inclusive=True)
+
+    def ceiling(self, key: Any) -> Any:
+        """
+        Returns the smallest key greater than or equal to `key`.
+        Returns None if no such key exists.
+        """
+        return self._upper(key, inclusive=True)
+
+    def predecessor(self, key: Any) -> Any:
+        """
+        Returns the largest key strictly less than `key`.
+        Returns None if no such key exists.
+        """
+        return self._lower(key, inclusive=False)
+
+    def successor(self, key: Any) -> Any:
+        """
+        Returns the smallest key strictly greater than `key`.
+        Returns None if no such key exists.
+        """
+        return self._upper(key, inclusive=False)
+
+    def range(self, lo: Any, hi: Any) -> Iterator[Any]:
+        """
+        Lazily yields the keys in the range [lo, hi] in ascending order.
+        Only the O(height + k) nodes on the boundary paths and within
+        the range are visited.
+        """
+        stack: list[Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                if node.key < lo:
+                    # The left subtree is entirely below the range.
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key
+            node = node.right
+
+    def iter_preorder(self) -> Iterator[Any]:
+        """
+        Pre-order traversal of the BST.
+        Lazily yields all keys using O(height) memory.
+        """
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        In-order traversal of the BST.
+        Lazily yields all keys in ascending order using O(height) memory.
+        """
+        stack: list[Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def iter_postorder(self) -> Iterator[Any]:
+        """
+        Post-order traversal of the BST.
+        Lazily yields all keys using O(height) memory.
+        """
+        stack: list[Node] = []
+        node = self._root
+        last: Node | None = None
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                yield top.key
+                last = stack.pop()
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_inorder()
 
     def preorder(self) -> list[Any]:
         """
         Pre-order traversal of the BST.
         Returns a list containing all keys.
         """
-        lst: list[Any] = list()
-        self._preorder(self._root, lst)
-        return lst
-
-    def _inorder(self, node: Node | None, lst: list[Any]) -> None:
-        if node is None:
-            return
-        self._inorder(node.left, lst)
-        lst.append(node.key)
-        self._inorder(node.right, lst)
+        return list(self.iter_preorder())
 
     def inorder(self) -> list[Any]:
         """
         In-order traversal of the BST.
         Returns a list containing all keys.
         """
-        lst: list[Any] = list()
-        self._inorder(self._root, lst)
-        return lst
-
-    def _postorder(self, node: Node | None, lst: list[Any]) -> None:
-        if node is None:
-            return
-        self._postorder(node.left, lst)
-        self._postorder(node.right, lst)
-        lst.append(node.key)
+        return list(self.iter_inorder())
 
     def postorder(self) -> list[Any]:
         """
         Post-order traversal of the BST.
         Returns a list containing all keys.
         """
-        lst: list[Any] = list()
-        self._postorder(self._root, lst)
-        return lst
+        return list(self.iter_postorder())
+
+
+class AVLTree(BinarySearchTree):
+    """
+    A self-balancing binary search tree. After every insert and delete, the
+    heights of the two subtrees of any node differ by at most one, so the
+    height of the tree is O(log n) regardless of the insertion order.
+    """
+
+    def _rotate_left(self, node: Node) -> Node:
+        assert node.right is not None
+        node = self._copy(node)
+        pivot = self._copy(node.right)
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: Node) -> Node:
+        assert node.left is not None
+        node = self._copy(node)
+        pivot = self._copy(node.left)
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: Node) -> Node:
+        self._update(node)
+        balance = height(node.left) - height(node.right)
+        if balance > 1:
+            # Left heavy
+            assert node.left is not None
+            if height(node.left.left) < height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            # Right heavy
+            assert node.right is not None
+            if height(node.right.right) < height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+
+class PersistentAVLTree(AVLTree):
+    """
+    An AVL tree whose nodes are never modified once they are reachable.
+    Inserts and deletes copy the O(log n) nodes on the modified path and
+    then publish the new root with a single assignment, so snapshots are
+    O(1) and readers of a snapshot never observe a partial update.
+    """
+
+    def _copy(self, node: Node) -> Node:
+        copy = Node(node.key)
+        copy.left = node.left
+        copy.right = node.right
+        copy.height = node.height
+        copy.size = node.size
+        return copy
+
+    def insert(self, key: Any) -> Node | None:  # type: ignore[override]
+        """
+        Insert a node with the specified key.
+        Returns the root of the new version of the tree.
+        """
+        super().insert(key)
+        return self._root
+
+    def delete(self, key: Any) -> Node | None:  # type: ignore[override]
+        """
+        Remove a node with the specified key.
+        Returns the root of the new version of the tree.
+        """
+        super().delete(key)
+        return self._root
+
+    def snapshot(self) -> PersistentAVLTree:
+        """
+        Returns an independent tree sharing all nodes with the current
+        version. Later changes to either tree do not affect the other.
+        """
+        tree = type(self)()
+        tree._root = self._root
+        return tree
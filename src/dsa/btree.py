@@ -0,0 +1,536 @@
+"""
+This module provides an implementation for a B-tree. It exposes the same
+API as `dsa.bst.BinarySearchTree`, but stores many sorted keys per node in
+contiguous lists, so lookups visit far fewer objects.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from heapq import merge
+from typing import Any
+
+
+class BTreeNode:
+    """
+    A B-tree node holding sorted keys. Internal nodes have one more
+    child than keys; the keys of children[i] lie between keys[i - 1]
+    and keys[i].
+    """
+
+    __slots__ = ("keys", "children", "size")
+
+    def __init__(
+        self,
+        keys: list[Any] | None = None,
+        children: list[BTreeNode] | None = None,
+    ) -> None:
+        self.keys: list[Any] = keys if keys is not None else []
+        self.children: list[BTreeNode] = children if children is not None else []
+        self.size: int = 0
+
+    @property
+    def leaf(self) -> bool:
+        """
+        Whether the node has no children.
+        """
+        return not self.children
+
+    def __repr__(self) -> str:
+        return f"<BTreeNode(keys={self.keys})>"
+
+
+class BTreeMatch:
+    """
+    The position of a key found by `BTree.search`. Like the nodes returned
+    by `BinarySearchTree.search`, it exposes the found key as `key`.
+    """
+
+    __slots__ = ("node", "index")
+
+    def __init__(self, node: BTreeNode, index: int) -> None:
+        self.node: BTreeNode = node
+        self.index: int = index
+
+    @property
+    def key(self) -> Any:
+        """
+        The key found, `node.keys[index]`.
+        """
+        return self.node.keys[self.index]
+
+    def __repr__(self) -> str:
+        return f"<BTreeMatch(key={self.key})>"
+
+
+def size(node: BTreeNode | None) -> int:
+    """
+    Returns the number of keys in the subtree rooted at `node`.
+    """
+    return node.size if node is not None else 0
+
+
+def _update(node: BTreeNode) -> None:
+    """Recompute the subtree size of `node` from its children."""
+    node.size = len(node.keys) + sum(child.size for child in node.children)
+
+
+class BTree:
+    def __init__(self, order: int = 64) -> None:
+        """
+        Instantiate an empty B-tree. Every node has at most `order` children
+        and every node except the root has at least `order // 2` children.
+        """
+        if order < 4 or order % 2:
+            raise ValueError("order must be an even number greater than two")
+        self._root: BTreeNode | None = None
+        self._order: int = order
+        self._t: int = order // 2  # Minimum degree
+
+    @property
+    def root(self) -> BTreeNode | None:
+        """
+        The root node of the B-tree.
+        """
+        return self._root
+
+    @property
+    def order(self) -> int:
+        """
+        The maximum number of children of a node.
+        """
+        return self._order
+
+    @property
+    def height(self) -> int:
+        """
+        The number of nodes on the path from the root to any leaf.
+        """
+        result = 0
+        node = self._root
+        while node is not None:
+            result += 1
+            node = node.children[0] if node.children else None
+        return result
+
+    @property
+    def size(self) -> int:
+        """
+        The number of keys in the B-tree.
+        """
+        return size(self._root)
+
+    @classmethod
+    def from_sorted(cls, keys: Iterable[Any], order: int = 64) -> BTree:
+        """
+        Build a B-tree from an iterable of sorted keys in O(n).
+        Duplicated keys are removed.
+        """
+        tree = cls(order)
+        tree._root = tree._build(keys)
+        return tree
+
+    def _build(self, keys: Iterable[Any]) -> BTreeNode | None:
+        """
+        Build a subtree by appending sorted keys to the rightmost leaf and
+        splitting full nodes on the right spine upwards.
+        """
+        t = self._t
+        spine: list[BTreeNode] = []  # Rightmost node of each level, leaf first
+        for key in keys:
+            if not spine:
+                spine.append(BTreeNode())
+            elif key == spine[0].keys[-1]:
+                continue
+            elif key < spine[0].keys[-1]:
+                raise ValueError("keys must be sorted")
+            spine[0].keys.append(key)
+            level = 0
+            while len(spine[level].keys) == self._order:
+                node = spine[level]
+                median = node.keys[t]
+                right = BTreeNode(node.keys[t + 1 :], node.children[t + 1 :])
+                del node.keys[t:]
+                del node.children[t + 1 :]
+                if level + 1 == len(spine):
+                    spine.append(BTreeNode([], [node]))
+                spine[level + 1].keys.append(median)
+                spine[level + 1].children.append(right)
+                spine[level] = right
+                level += 1
+
+        if not spine:
+            return None
+        root = spine[-1]
+        # Compute subtree sizes bottom-up.
+        stack = [root]
+        order: list[BTreeNode] = []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children)
+        for node in reversed(order):
+            _update(node)
+        return root
+
+    def merge(self, other: BTree) -> None:
+        """
+        Insert all keys of `other` by merging the in-order key streams of both
+        trees and rebuilding the B-tree in O(n + m).
+        """
+        self._root = self._build(merge(self.iter_inorder(), other.iter_inorder()))
+
+    def search(self, key: Any) -> BTreeMatch | None:
+        """
+        Search for the specified key. Returns the node containing it and
+        its position within the node, or None if the key does not exist.
+        """
+        node = self._root
+        while node is not None:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                return BTreeMatch(node, i)
+            node = node.children[i] if node.children else None
+        return None
+
+    def _split_child(self, parent: BTreeNode, i: int) -> None:
+        """Split the full child `i` of `parent` around its median key."""
+        t = self._t
+        child = parent.children[i]
+        right = BTreeNode(child.keys[t:], child.children[t:])
+        parent.keys.insert(i, child.keys[t - 1])
+        parent.children.insert(i + 1, right)
+        del child.keys[t - 1 :]
+        del child.children[t:]
+        _update(child)
+        _update(right)
+
+    def insert(self, key: Any) -> None:
+        """
+        Insert the specified key.
+        """
+        if self.search(key) is not None:
+            return
+        root = self._root
+        if root is None:
+            self._root = BTreeNode([key])
+            self._root.size = 1
+            return
+        if len(root.keys) == self._order - 1:
+            root = BTreeNode([], [root])
+            root.size = root.children[0].size
+            self._split_child(root, 0)
+            self._root = root
+
+        # Split full nodes on the way down, so the leaf always has room.
+        node = root
+        while True:
+            node.size += 1
+            i = bisect_left(node.keys, key)
+            if node.leaf:
+                node.keys.insert(i, key)
+                return
+            if len(node.children[i].keys) == self._order - 1:
+                self._split_child(node, i)
+                if key > node.keys[i]:
+                    i += 1
+            node = node.children[i]
+
+    def _fill_child(self, node: BTreeNode, i: int) -> BTreeNode:
+        """
+        Ensure child `i` of `node` has at least t keys before descending into
+        it, by borrowing a key from a sibling or merging with a sibling.
+        Returns the child to descend into.
+        """
+        t = self._t
+        child = node.children[i]
+        if len(child.keys) >= t:
+            return child
+        left = node.children[i - 1] if i > 0 else None
+        right = node.children[i + 1] if i + 1 < len(node.children) else None
+
+        if left is not None and len(left.keys) >= t:
+            # Rotate a key from the left sibling through the parent.
+            child.keys.insert(0, node.keys[i - 1])
+            node.keys[i - 1] = left.keys.pop()
+            if left.children:
+                child.children.insert(0, left.children.pop())
+            _update(left)
+            _update(child)
+            return child
+        if right is not None and len(right.keys) >= t:
+            # Rotate a key from the right sibling through the parent.
+            child.keys.append(node.keys[i])
+            node.keys[i] = right.keys.pop(0)
+            if right.children:
+                child.children.append(right.children.pop(0))
+            _update(right)
+            _update(child)
+            return child
+
+        # Merge with a sibling around the separating parent key.
+        return self._merge_children(node, i if right is not None else i - 1)
+
+    def _merge_children(self, node: BTreeNode, i: int) -> BTreeNode:
+        """
+        Merge children `i` and `i + 1` of `node` around the key separating
+        them. Returns the merged child.
+        """
+        child = node.children[i]
+        right = node.children.pop(i + 1)
+        child.keys.append(node.keys.pop(i))
+        child.keys.extend(right.keys)
+        child.children.extend(right.children)
+        _update(child)
+        return child
+
+    def delete(self, key: Any) -> None:
+        """
+        Remove the specified key.
+        """
+        if self.search(key) is None:
+            return
+        assert self._root is not None
+        t = self._t
+        path: list[BTreeNode] = []
+        node = self._root
+        while True:
+            path.append(node)
+            i = bisect_left(node.keys, key)
+            found = i < len(node.keys) and node.keys[i] == key
+            if node.leaf:
+                node.keys.pop(i)
+                break
+            if not found:
+                node = self._fill_child(node, i)
+                continue
+
+            left, right = node.children[i], node.children[i + 1]
+            if len(left.keys) >= t:
+                # Replace the key with its predecessor and delete that instead.
+                predecessor = left
+                while predecessor.children:
+                    predecessor = predecessor.children[-1]
+                key = node.keys[i] = predecessor.keys[-1]
+                node = left
+            elif len(right.keys) >= t:
+                # Replace the key with its successor and delete that instead.
+                successor = right
+                while successor.children:
+                    successor = successor.children[0]
+                key = node.keys[i] = successor.keys[0]
+                node = right
+            else:
+                node = self._merge_children(node, i)
+
+        for node in reversed(path):
+            _update(node)
+        root = self._root
+        if not root.keys:
+            self._root = root.children[0] if root.children else None
+
+    def min(self) -> Any:
+        """
+        Returns the smallest key, or None if the B-tree is empty.
+        """
+        node = self._root
+        if node is None:
+            return None
+        while node.children:
+            node = node.children[0]
+        return node.keys[0]
+
+    def max(self) -> Any:
+        """
+        Returns the largest key, or None if the B-tree is empty.
+        """
+        node = self._root
+        if node is None:
+            return None
+        while node.children:
+            node = node.children[-1]
+        return node.keys[-1]
+
+    def _lower(self, key: Any, inclusive: bool) -> Any:
+        """Returns the largest key less than (or equal to) `key`."""
+        bisect = bisect_right if inclusive else bisect_left
+        result = None
+        node = self._root
+        while node is not None:
+            i = bisect(node.keys, key)
+            if i > 0:
+                result = node.keys[i - 1]
+            node = node.children[i] if node.children else None
+        return result
+
+    def _upper(self, key: Any, inclusive: bool) -> Any:
+        """Returns the smallest key greater than (or equal to) `key`."""
+        bisect = bisect_left if inclusive else bisect_right
+        result = None
+        node = self._root
+        while node is not None:
+            i = bisect(node.keys, key)
+            if i < len(node.keys):
+                result = node.keys[i]
+            node = node.children[i] if node.children else None
+        return result
+
+    def floor(self, key: Any) -> Any:
+        """
+        Returns the largest key less than or equal to `key`.
+        Returns None if no such key exists.
+        """
+        return self._lower(key, inclusive=True)
+
+    def ceiling(self, key: Any) -> Any:
+        """
+        Returns the smallest key greater than or equal to `key`.
+        Returns None if no such key exists.
+        """
+        return self._upper(key, inclusive=True)
+
+    def predecessor(self, key: Any) -> Any:
+        """
+        Returns the largest key strictly less than `key`.
+        Returns None if no such key exists.
+        """
+        return self._lower(key, inclusive=False)
+
+    def successor(self, key: Any) -> Any:
+        """
+        Returns the smallest key strictly greater than `key`.
+        Returns None if no such key exists.
+        """
+        return self._upper(key, inclusive=False)
+
+    def _rank(self, key: Any, inclusive: bool) -> int:
+        """Count the keys less than (or equal to, if `inclusive`) `key`."""
+        bisect = bisect_right if inclusive else bisect_left
+        rank = 0
+        node = self._root
+        while node is not None:
+            i = bisect(node.keys, key)
+            rank += i + sum(child.size for child in node.children[:i])
+            node = node.children[i] if node.children else None
+        return rank
+
+    def rank(self, key: Any) -> int:
+        """
+        Returns the number of keys less than `key`.
+        """
+        return self._rank(key, inclusive=False)
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest key, counting from zero.
+        """
+        if not (0 <= k < self.size):
+            raise IndexError("k is out of bounds")
+        node = self._root
+        while node is not None:
+            if node.leaf:
+                return node.keys[k]
+            for i, child in enumerate(node.children):
+                if k < child.size:
+                    node = child
+                    break
+                k -= child.size
+                if k == 0:
+                    return node.keys[i]
+                k -= 1
+        raise AssertionError("subtree sizes are inconsistent")
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """
+        Returns the number of keys in the range [lo, hi].
+        """
+        return max(0, self._rank(hi, inclusive=True) - self._rank(lo, inclusive=False))
+
+    def _scan(self, lo: Any = None) -> Iterator[Any]:
+        """
+        Lazily yields keys in ascending order, starting from the first key
+        greater than or equal to `lo` (or the smallest key if `lo` is None).
+        """
+        stack: list[tuple[BTreeNode, int]] = []
+        node = self._root
+        while node is not None:
+            i = 0 if lo is None else bisect_left(node.keys, lo)
+            stack.append((node, i))
+            node = node.children[i] if node.children else None
+        while stack:
+            node, i = stack.pop()
+            if i == len(node.keys):
+                continue
+            yield node.keys[i]
+            stack.append((node, i + 1))
+            child = node.children[i + 1] if node.children else None
+            while child is not None:
+                stack.append((child, 0))
+                child = child.children[0] if child.children else None
+
+    def range(self, lo: Any, hi: Any) -> Iterator[Any]:
+        """
+        Lazily yields the keys in the range [lo, hi] in ascending order.
+        """
+        for key in self._scan(lo):
+            if key > hi:
+                return
+            yield key
+
+    def iter_preorder(self) -> Iterator[Any]:
+        """
+        Pre-order traversal of the B-tree. The keys of each node are
+        yielded before the keys of its children.
+        """
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            yield from node.keys
+            stack.extend(reversed(node.children))
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        In-order traversal of the B-tree.
+        Lazily yields all keys in ascending order using O(height) memory.
+        """
+        return self._scan()
+
+    def iter_postorder(self) -> Iterator[Any]:
+        """
+        Post-order traversal of the B-tree. The keys of each node are
+        yielded after the keys of its children.
+        """
+        stack: list[tuple[BTreeNode, bool]] = []
+        if self._root is not None:
+            stack.append((self._root, False))
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                yield from node.keys
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_inorder()
+
+    def preorder(self) -> list[Any]:
+        """
+        Pre-order traversal of the B-tree.
+        Returns a list containing all keys.
+        """
+        return list(self.iter_preorder())
+
+    def inorder(self) -> list[Any]:
+        """
+        In-order traversal of the B-tree.
+        Returns a list containing all keys.
+        """
+        return list(self.iter_inorder())
+
+    def postorder(self) -> list[Any]:
+        """
+        Post-order traversal of the B-tree.
+        Returns a list containing all keys.
+        """
+        return list(self.iter_postorder())
@@ -2,35 +2,142 @@
 This module provides an implementation for disjoint set.
 """
 
-from collections.abc import Hashable, Iterable
+from __future__ import annotations
+
+import operator
+import os
+import pickle
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Hashable, Iterable, Iterator, MutableSequence
+from mmap import ACCESS_READ, mmap as memory_map
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch operations fall back to loops.
+    np = None
+
+# Magic, format version, flags, number of elements and number of components.
+_HEADER = struct.Struct("<4sBBxxqq")
+_MAGIC = b"DSET"
+_VERSION = 1
+_LABELED = 1
+_BIG_ENDIAN = 2
+
+# The vectorized batch operations cost O(n) per call, so batches of fewer
+# than n / _BATCH_RATIO elements are processed with loops instead.
+_BATCH_RATIO = 32
 
 
 class DisjointSet:
-    def __init__(self, elements: Iterable[Hashable]) -> None:
+    def __init__(self, elements: Iterable[Hashable], rollback: bool = False) -> None:
         """
         Initialize the DisjointSet data structure with a set of elements.
 
         At initialization, each element will be in its own component.
         Duplicated elements are removed.
+
+        If `rollback` is true, unions are recorded so they can be undone
+        with `checkpoint` and `rollback`. Paths are then not compressed,
+        so `find` runs in O(log n) thanks to union by size.
         """
-        self._index_map: dict[int, Hashable] = {}
-        self._element_map: dict[Hashable, int] = {}
-        self._array: list[int] = list()
-        self._size: list[int] = list()
+        self._index_map: dict[int, Hashable] | None = {}
+        self._element_map: dict[Hashable, int] | None = {}
+        self._array: MutableSequence[int] = list()
+        self._size: MutableSequence[int] = list()
+        self._next: MutableSequence[int] = list()  # Circular list of members
+        self._components: int = 0
+        # (attached root, new root) of every union, if rollback is enabled
+        self._history: list[tuple[int, int]] | None = [] if rollback else None
+        self._compress: bool = not rollback  # Whether paths are compressed
+        self._mmap: memory_map | None = None
+
+        for element in elements:
+            self.add(element)
 
-        elements = set(elements)
-        for i, element in enumerate(elements):
+    @classmethod
+    def range(cls, n: int, rollback: bool = False) -> DisjointSet:
+        """
+        Initialize the DisjointSet data structure with the integers 0..n-1.
+
+        The integers are used as indices directly, so no mapping between
+        elements and indices is stored, and the parent and size of every
+        element are kept in compact `array('i')` buffers.
+        """
+        if n < 0:
+            raise ValueError("n must be greater than or equal to zero")
+        ds = cls.__new__(cls)
+        ds._index_map = None
+        ds._element_map = None
+        ds._array = array("i", range(n))
+        ds._size = array("i", [1]) * n
+        ds._next = array("i", range(n))
+        ds._components = n
+        ds._history = [] if rollback else None
+        ds._compress = not rollback
+        ds._mmap = None
+        return ds
+
+    def add(self, element: Hashable) -> None:
+        """
+        Add an element in its own component.
+        Elements already in the set are ignored.
+
+        Sets created with `DisjointSet.range(n)` can only grow
+        by the next integer, n.
+        """
+        if self._mmap is not None:
+            raise TypeError("A memory-mapped DisjointSet is read-only.")
+        i = len(self._array)
+        if self._element_map is None:
+            index = self._as_index(element)
+            if 0 <= index < i:
+                return
+            if index != i:
+                raise ValueError("Only the next integer can be added.")
+        else:
+            if element in self._element_map:
+                return
+            assert self._index_map is not None
             self._index_map[i] = element
             self._element_map[element] = i
-            self._array.append(i)
-            self._size.append(1)
+        self._array.append(i)
+        self._size.append(1)
+        self._next.append(i)
+        self._components += 1
+
+    @property
+    def num_components(self) -> int:
+        """
+        The number of components.
+        """
+        return self._components
 
     def _get_element(self, index: int) -> Hashable:
         if not (0 <= index < len(self._array)):
             raise IndexError("Index is out of bounds")
+        if self._index_map is None:
+            return index
         return self._index_map[index]
 
+    @staticmethod
+    def _as_index(element: Hashable) -> int:
+        """Convert integer-like elements (e.g., NumPy integers), else -1."""
+        try:
+            return operator.index(element)  # type: ignore[arg-type]
+        except TypeError:
+            return -1
+
     def _get_index(self, element: Hashable) -> int:
+        if self._element_map is None:
+            # Plain ints skip the conversion, which dominates a lookup.
+            i = element if type(element) is int else self._as_index(element)
+            if 0 <= i < len(self._array):
+                return i
+            raise ValueError("Element is not in the UnionFind set.")
         if element not in self._element_map:
             raise ValueError("Element is not in the UnionFind set.")
         return self._element_map[element]
@@ -41,25 +148,47 @@ class DisjointSet:
 
         if irep == jrep:
             return
+        if self._mmap is not None:
+            raise TypeError("A memory-mapped DisjointSet is read-only.")
 
         isize = self._size[irep]
         jsize = self._size[jrep]
         if isize < jsize:
-            self._array[irep] = jrep
-            self._size[jrep] += isize
-        else:
-            self._array[jrep] = irep
-            self._size[irep] += jsize
+            irep, jrep = jrep, irep
+        self._array[jrep] = irep
+        self._size[irep] += self._size[jrep]
+
+        # Swapping the successors splices the two circular member lists.
+        self._next[irep], self._next[jrep] = self._next[jrep], self._next[irep]
+        self._components -= 1
+        if self._history is not None:
+            self._history.append((jrep, irep))
 
     def _find(self, i: int) -> int:
-        if i != self._array[i]:
-            self._array[i] = self._find(self._array[i])  # Path compression
-        return self._array[i]
+        array = self._array
+        root = i
+        while root != array[root]:
+            root = array[root]
+        if not self._compress:
+            return root
+        while i != root:
+            array[i], i = root, array[i]  # Path compression
+        return root
 
     def union(self, element_1: Hashable, element_2: Hashable) -> None:
         """
         Merge two components.
         """
+        n = len(self._array)
+        if (
+            self._element_map is None
+            and type(element_1) is int
+            and type(element_2) is int
+            and 0 <= element_1 < n
+            and 0 <= element_2 < n
+        ):
+            self._union(element_1, element_2)  # Fast path for `DisjointSet.range`
+            return
         i = self._get_index(element_1)
         j = self._get_index(element_2)
         self._union(i, j)
@@ -70,6 +199,328 @@ class DisjointSet:
         same component if they result in the same representative component.
         (e.g., find(x) == find(y)).
         """
-        i = self._get_index(element)
-        irep = self._find(i)
-        return self._index_map[irep]
+        if self._index_map is None:
+            if type(element) is int and 0 <= element < len(self._array):
+                return self._find(element)  # Fast path for `DisjointSet.range`
+            return self._find(self._get_index(element))
+        return self._index_map[self._find(self._get_index(element))]
+
+    def checkpoint(self) -> int:
+        """
+        Returns a token identifying the current state, to be passed
+        to `rollback`. Requires rollback to be enabled.
+        """
+        if self._history is None:
+            raise ValueError("Rollback is not enabled.")
+        return len(self._history)
+
+    def rollback(self, checkpoint: int) -> None:
+        """
+        Undo every union made since `checkpoint` was taken, in O(k) for
+        k undone unions. Elements added since then are kept, each in its
+        own component.
+        """
+        if self._history is None:
+            raise ValueError("Rollback is not enabled.")
+        if not (0 <= checkpoint <= len(self._history)):
+            raise ValueError("Invalid checkpoint.")
+        while len(self._history) > checkpoint:
+            jrep, irep = self._history.pop()
+            self._array[jrep] = jrep
+            self._size[irep] -= self._size[jrep]
+            # Swapping the successors again splits the member lists.
+            self._next[irep], self._next[jrep] = self._next[jrep], self._next[irep]
+            self._components += 1
+
+    def component_size(self, element: Hashable) -> int:
+        """
+        Returns the number of elements in the component of `element`.
+        """
+        return self._size[self._find(self._get_index(element))]
+
+    def members(self, element: Hashable) -> Iterator[Hashable]:
+        """
+        Lazily yields every element in the component of `element`,
+        in time proportional to the size of the component.
+        """
+        start = i = self._get_index(element)
+        while True:
+            yield self._get_element(i)
+            i = self._next[i]
+            if i == start:
+                return
+
+    def _vectorized(self, values: Any) -> bool:
+        """Whether `values` can be processed with NumPy in bulk."""
+        return (
+            np is not None
+            and self._element_map is None
+            and self._compress
+            and isinstance(values, np.ndarray)
+        )
+
+    def _check_indices(self, indices: Any) -> None:
+        if indices.size and (indices.min() < 0 or indices.max() >= len(self._array)):
+            raise ValueError("Element is not in the UnionFind set.")
+
+    def _small(self, batch: int) -> bool:
+        """Whether a batch of `batch` elements is cheaper to process in a loop."""
+        return batch * _BATCH_RATIO < len(self._array)
+
+    def _roots(self) -> Any:
+        """
+        Point every element directly at its representative using vectorized
+        pointer jumping. Returns the parents as a NumPy array.
+        """
+        labels = np.asarray(self._array, dtype=np.intp)
+        while True:
+            parents = labels[labels]
+            if np.array_equal(parents, labels):
+                break
+            labels = parents
+        self._array = array("i", labels.astype(np.intc).tobytes())
+        return labels
+
+    def union_many(self, edges: Iterable[tuple[Hashable, Hashable]]) -> None:
+        """
+        Merge the components of every pair of elements in `edges`.
+
+        For sets created with `DisjointSet.range`, a NumPy array of shape
+        (m, 2) is processed in bulk: the representatives of both ends of every
+        edge are hooked together (the larger under the smaller) and paths are
+        shortened by pointer jumping, repeating until no edge joins two
+        components. Each bulk call costs O(n log n) on top of the edges, so
+        arrays with fewer than n / 32 edges are unioned one by one instead.
+        """
+        if not self._vectorized(edges):
+            for element_1, element_2 in edges:
+                self._union(self._get_index(element_1), self._get_index(element_2))
+            return
+
+        edges = np.asarray(edges, dtype=np.intp)
+        if edges.ndim != 2 or edges.shape[1] != 2:
+            raise ValueError("edges must have shape (m, 2)")
+        self._check_indices(edges)
+        if self._small(len(edges)):
+            for i, j in edges.tolist():
+                self._union(i, j)
+            return
+        u, v = edges[:, 0], edges[:, 1]
+        labels = self._roots()
+        while True:
+            lu, lv = labels[u], labels[v]
+            pending = lu != lv
+            if not pending.any():
+                break
+            u, v, lu, lv = u[pending], v[pending], lu[pending], lv[pending]
+            np.minimum.at(labels, np.maximum(lu, lv), np.minimum(lu, lv))
+            while True:
+                parents = labels[labels]
+                if np.array_equal(parents, labels):
+                    break
+                labels = parents
+
+        sizes = np.bincount(labels, minlength=len(labels))
+        self._array = array("i", labels.astype(np.intc).tobytes())
+        self._size = array("i", sizes.astype(np.intc).tobytes())
+        self._relink(labels)
+
+    def _relink(self, labels: Any) -> None:
+        """
+        Rebuild the circular member lists and component count from the
+        representative of every element.
+        """
+        n = len(labels)
+        if n == 0:
+            return
+        order = np.argsort(labels, kind="stable")
+        grouped = labels[order]
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+        ends = np.r_[starts[1:], n] - 1
+        successors = np.empty(n, dtype=np.intp)
+        successors[order[:-1]] = order[1:]
+        successors[order[ends]] = order[starts]
+        self._next = array("i", successors.astype(np.intc).tobytes())
+        self._components = len(starts)
+
+    def find_many(self, elements: Iterable[Hashable]) -> Any:
+        """
+        Find the representative component of every element in `elements`.
+
+        For sets created with `DisjointSet.range`, a NumPy array of elements
+        is resolved in bulk and a NumPy array of representatives is returned.
+        Each bulk call flattens the whole forest in O(n), so arrays with fewer
+        than n / 32 elements are resolved one by one instead.
+        Otherwise, a list of representatives is returned.
+        """
+        if not self._vectorized(elements):
+            return [self.find(element) for element in elements]
+        indices = np.asarray(elements, dtype=np.intp)
+        self._check_indices(indices)
+        if self._small(indices.size):
+            roots = [self._find(i) for i in indices.ravel().tolist()]
+            return np.array(roots, dtype=np.intp).reshape(indices.shape)
+        return self._roots()[indices]
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Write the set to the file at `path` in a compact binary format.
+
+        The parent, size and successor of every element are stored as
+        `array('i')` buffers, followed for labeled sets by the list of
+        elements, pickled once in index order. Paths are compressed before
+        saving so that loaded sets answer `find` in one or two steps.
+        Rollback history is not saved.
+        """
+        n = len(self._array)
+        if self._compress:
+            for i in range(n):
+                self._find(i)
+        flags = _BIG_ENDIAN if sys.byteorder == "big" else 0
+        if self._index_map is not None:
+            flags |= _LABELED
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, flags, n, self._components))
+            for values in (self._array, self._size, self._next):
+                file.write(array("i", values).tobytes())
+            if self._index_map is not None:
+                labels = [self._index_map[i] for i in range(n)]
+                pickle.dump(labels, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, mmap: bool = True) -> DisjointSet:
+        """
+        Load a set written by `save`.
+
+        If `mmap` is true, the arrays are memory-mapped read-only instead of
+        being read, so loading is instant and processes opening the same file
+        share a single copy. Such a set supports `find` and the other queries
+        without compressing paths, but raises TypeError on `add` and on any
+        union that would merge two components. Call `close` to unmap it.
+
+        The labels of a labeled set are unpickled, so only load trusted files.
+        """
+        with open(path, "rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("File is not a saved DisjointSet.")
+            magic, version, flags, n, components = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError("File is not a saved DisjointSet.")
+            if version != _VERSION:
+                raise ValueError(f"Unsupported DisjointSet format version {version}.")
+            swap = bool(flags & _BIG_ENDIAN) != (sys.byteorder == "big")
+            if swap and mmap:
+                raise ValueError("Byte order mismatch; load with mmap=False.")
+
+            ds = cls.__new__(cls)
+            ds._components = components
+            ds._history = None
+            ds._compress = not mmap
+            ds._mmap = None
+            itemsize = array("i").itemsize
+            nbytes = n * itemsize
+            if mmap:
+                mapping = memory_map(file.fileno(), 0, access=ACCESS_READ)
+                buffer = memoryview(mapping)
+                offsets = [_HEADER.size + k * nbytes for k in range(3)]
+                end = _HEADER.size + 3 * nbytes
+                if len(buffer) < end:
+                    buffer.release()
+                    mapping.close()
+                    raise ValueError("File is truncated.")
+                ds._array, ds._size, ds._next = (
+                    buffer[offset : offset + nbytes].cast("i") for offset in offsets
+                )
+                buffer.release()
+                ds._mmap = mapping
+                file.seek(end)
+            else:
+                arrays = []
+                for _ in range(3):
+                    values = array("i")
+                    data = file.read(nbytes)
+                    if len(data) < nbytes:
+                        raise ValueError("File is truncated.")
+                    values.frombytes(data)
+                    if swap:
+                        values.byteswap()
+                    arrays.append(values)
+                ds._array, ds._size, ds._next = arrays
+
+            if flags & _LABELED:
+                labels = pickle.load(file)
+                ds._index_map = dict(enumerate(labels))
+                ds._element_map = {element: i for i, element in enumerate(labels)}
+            else:
+                ds._index_map = None
+                ds._element_map = None
+        return ds
+
+    def close(self) -> None:
+        """
+        Unmap a set loaded with `DisjointSet.load(path, mmap=True)`.
+        Does nothing for in-memory sets.
+        """
+        if self._mmap is not None:
+            for values in (self._array, self._size, self._next):
+                values.release()  # type: ignore[attr-defined]
+            self._mmap.close()
+
+
+def _shard_forest(edges: Any, n: int | None) -> Any:
+    """
+    Union one shard of edges and return an (element, representative) pair
+    for every element of the shard that is not its own representative.
+    """
+    if n is None:
+        elements = {element for edge in edges for element in edge}
+        ds = DisjointSet(elements)
+        ds.union_many(edges)
+        return [(e, rep) for e in elements if (rep := ds.find(e)) != e]
+
+    ds = DisjointSet.range(n)
+    ds.union_many(edges)
+    if np is not None:
+        labels = ds.find_many(np.arange(n))
+        moved = np.flatnonzero(labels != np.arange(n))
+        return np.column_stack((moved, labels[moved]))
+    return [(i, rep) for i in range(n) if (rep := ds.find(i)) != i]
+
+
+def parallel_components(
+    edges: Iterable[tuple[Hashable, Hashable]],
+    workers: int | None = None,
+    n: int | None = None,
+) -> DisjointSet:
+    """
+    Compute the connected components of a graph using a pool of processes.
+
+    The edges are split into one shard per worker and each worker builds a
+    DisjointSet of its shard. The partial forests are merged by unioning
+    every (element, representative) pair they contain, which gives the same
+    components as unioning every edge but needs at most one union per
+    element of each shard.
+
+    If `n` is given, the elements are the integers 0..n-1 and the result is
+    created with `DisjointSet.range(n)`; a NumPy edge array of shape (m, 2)
+    is then sharded without conversion. Otherwise, the result contains the
+    elements found in `edges`.
+    """
+    workers = workers or os.cpu_count() or 1
+    if n is not None and np is not None and isinstance(edges, np.ndarray):
+        shards = [shard for shard in np.array_split(edges, workers) if len(shard)]
+        ds = DisjointSet.range(n)
+    else:
+        edges = list(edges)
+        size = -(-len(edges) // workers)
+        shards = [edges[i : i + size] for i in range(0, len(edges), size or 1)]
+        if n is None:
+            ds = DisjointSet(element for edge in edges for element in edge)
+        else:
+            ds = DisjointSet.range(n)
+
+    with ProcessPoolExecutor(workers) as executor:
+        for pairs in executor.map(_shard_forest, shards, [n] * len(shards)):
+            ds.union_many(pairs)
+    return ds
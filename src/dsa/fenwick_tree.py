@@ -4,6 +4,14 @@ This module provides implementation for a Fenwick Tree.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; arrays are accepted as iterables.
+    np = None
+
 
 def LSB(i: int) -> int:
     """
@@ -20,13 +28,30 @@ class FenwickTree:
 
     def __init__(self, array: list[int]) -> None:
         """
-        Initialize the Fenwick Tree with the given array.
+        Initialize the Fenwick Tree with the given array in O(n) time.
         """
-        N = len(array) + 1
-        self.tree = [0] * N
+        self.tree = [0]
+        self.tree.extend(array)
+        N = len(self.tree)
         self.length = N
+        # Construct the tree by adding each node to its parent once, in
+        # increasing order so that every node is complete when it is added.
+        tree = self.tree
         for i in range(1, N):
-            self.update(i, array[i - 1])  # Construct the tree.
+            parent = i + LSB(i)
+            if parent < N:
+                tree[parent] += tree[i]
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int] | Any) -> FenwickTree:
+        """
+        Initialize the Fenwick Tree with the values of any iterable.
+        NumPy arrays are converted to lists of Python integers first,
+        so sums cannot overflow the array's dtype.
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            return cls(values.ravel().tolist())
+        return cls(list(values))
 
     def prefix_sum(self, i: int) -> int:
         """
@@ -53,3 +78,68 @@ class FenwickTree:
         while i < self.length:
             self.tree[i] += x
             i += LSB(i)
+
+
+class RangeFenwickTree:
+    """
+    Fenwick Tree supporting range updates and range queries on a list of
+    integers, both in O(log n). Indices are 1-based, as in FenwickTree.
+
+    Two Fenwick Trees are kept over the differences d[k] = a[k] - a[k-1]:
+    one over d[k] and one over d[k] * (k - 1), so that the prefix sum up to
+    i is i * sum(d[1..i]) - sum(d[k] * (k - 1) for k in 1..i).
+    """
+
+    def __init__(self, array: list[int]) -> None:
+        """
+        Initialize the Range Fenwick Tree with the given array in O(n) time.
+        """
+        values = list(array)
+        differences = [b - a for a, b in zip([0] + values, values)]
+        self.length = len(values) + 1
+        self._b1 = FenwickTree(differences)
+        self._b2 = FenwickTree([d * k for k, d in enumerate(differences)])
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int] | Any) -> RangeFenwickTree:
+        """
+        Initialize the Range Fenwick Tree with the values of any iterable.
+        NumPy arrays are converted to lists of Python integers first.
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            return cls(values.ravel().tolist())
+        return cls(list(values))
+
+    def prefix_sum(self, i: int) -> int:
+        """
+        Compute the prefix sum from the start of the array up to the given index.
+        """
+        if i < 0 or i >= self.length:
+            raise IndexError("Index out of bounds.")
+        return self._b1.prefix_sum(i) * i - self._b2.prefix_sum(i)
+
+    def range_query(self, i: int, j: int) -> int:
+        """
+        Compute the sum of elements in the range [i, j].
+        """
+        if i <= 0 or j >= self.length or i > j:
+            raise IndexError("Index out of bounds.")
+        return self.prefix_sum(j) - self.prefix_sum(i - 1)
+
+    def range_add(self, i: int, j: int, x: int) -> None:
+        """
+        Update every value in the range [i, j] by adding x to it.
+        """
+        if i <= 0 or j >= self.length or i > j:
+            raise IndexError("Index out of bounds.")
+        self._b1.update(i, x)
+        self._b2.update(i, x * (i - 1))
+        if j + 1 < self.length:
+            self._b1.update(j + 1, -x)
+            self._b2.update(j + 1, -x * j)
+
+    def update(self, i: int, x: int) -> None:
+        """
+        Update the value at index i by adding x to it.
+        """
+        self.range_add(i, i, x)
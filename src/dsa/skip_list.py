@@ -0,0 +1,190 @@
+"""
+This module provides an implementation for an indexable skip list.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterator
+from random import Random
+from typing import Any
+
+
+class Node:
+    def __init__(self, key: Any, level: int) -> None:
+        """
+        Instantiate a node linked on `level` levels. `width[i]` is the
+        number of positions the link `next[i]` advances in the list.
+        """
+        self.key: Any = key
+        self.next: list[Node | None] = [None] * level
+        self.width: list[int] = [1] * level
+
+    def __repr__(self) -> str:
+        return f"<Node(key={self.key})>"
+
+
+class SkipList:
+    """
+    An ordered set of keys stored in a sorted linked list with express
+    lanes. Each node is promoted to the next level with probability `p`,
+    so search, insert, delete and positional indexing take O(log n)
+    expected time regardless of the insertion order.
+    """
+
+    def __init__(
+        self, p: float = 0.5, max_level: int = 32, seed: int | None = None
+    ) -> None:
+        """
+        Instantiate an empty skip list. Pass a `seed` to make the
+        shape of the list reproducible.
+        """
+        if not (0 < p < 1):
+            raise ValueError("p must be between zero and one")
+        if max_level < 1:
+            raise ValueError("max_level must be greater than zero")
+        self._p = p
+        self._max_level = max_level
+        self._random = Random(seed)
+        self._head = Node(None, max_level)
+        self._level = 0  # Number of levels in use
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """
+        The number of keys in the skip list.
+        """
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self._max_level and self._random.random() < self._p:
+            level += 1
+        return level
+
+    def _predecessors(self, key: Any) -> tuple[list[Node], list[int]]:
+        """
+        Returns, for every level in use, the last node with a key less than
+        `key` and that node's position (the head is at position 0).
+        """
+        update: list[Node] = [self._head] * self._level
+        positions: list[int] = [0] * self._level
+        node = self._head
+        position = 0
+        for level in reversed(range(self._level)):
+            while (nxt := node.next[level]) is not None and nxt.key < key:
+                position += node.width[level]
+                node = nxt
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def search(self, key: Any) -> Node | None:
+        """
+        Search for a node with the specified key.
+        Returns None if the node does not exist.
+        """
+        node = self._head
+        for level in reversed(range(self._level)):
+            while (nxt := node.next[level]) is not None and nxt.key < key:
+                node = nxt
+        node = node.next[0] if self._level else None
+        if node is not None and node.key == key:
+            return node
+        return None
+
+    def insert(self, key: Any) -> None:
+        """
+        Insert a node with the specified key.
+        """
+        update, positions = self._predecessors(key)
+        if update and (nxt := update[0].next[0]) is not None and nxt.key == key:
+            return
+
+        level = self._random_level()
+        for i in range(self._level, level):
+            # Raise the head; its new links span the whole list.
+            self._head.next[i] = None
+            self._head.width[i] = self._size + 1
+            update.append(self._head)
+            positions.append(0)
+        self._level = max(self._level, level)
+
+        node = Node(key, level)
+        position = positions[0] if positions else 0
+        for i in range(level):
+            prev = update[i]
+            steps = position - positions[i]
+            node.next[i] = prev.next[i]
+            prev.next[i] = node
+            node.width[i] = prev.width[i] - steps
+            prev.width[i] = steps + 1
+        for i in range(level, self._level):
+            update[i].width[i] += 1
+        self._size += 1
+
+    def delete(self, key: Any) -> None:
+        """
+        Remove a node with the specified key.
+        """
+        update, _ = self._predecessors(key)
+        node = update[0].next[0] if update else None
+        if node is None or node.key != key:
+            return
+
+        for i in range(self._level):
+            prev = update[i]
+            if prev.next[i] is node:
+                prev.width[i] += node.width[i] - 1
+                prev.next[i] = node.next[i]
+            else:
+                prev.width[i] -= 1
+        while self._level and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    def rank(self, key: Any) -> int:
+        """
+        Returns the number of keys less than `key`.
+        """
+        _, positions = self._predecessors(key)
+        return positions[0] if positions else 0
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest key, counting from zero.
+        """
+        if not (0 <= k < self._size):
+            raise IndexError("k is out of bounds")
+        node = self._head
+        remaining = k + 1
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]  # type: ignore[assignment]
+        return node.key
+
+    def __getitem__(self, k: int) -> Any:
+        return self.select(k)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        In-order traversal of the skip list.
+        Lazily yields all keys in ascending order.
+        """
+        node = self._head.next[0] if self._level else None
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_inorder()
+
+    def inorder(self) -> list[Any]:
+        """
+        In-order traversal of the skip list.
+        Returns a list containing all keys.
+        """
+        return list(self.iter_inorder())
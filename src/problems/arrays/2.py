@@ -4,6 +4,11 @@
 # it doesn’t exist.
 # See: https://www.geeksforgeeks.org/linear-search/
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def search(array: list[int], key: int) -> int:
     """
@@ -17,6 +22,21 @@ def search(array: list[int], key: int) -> int:
     return -1
 
 
+def search_vectorized(array: list[int], key: int) -> int:
+    """
+    Same as `search`, but compares every element with key at once
+    using NumPy when it is installed.
+    """
+    if np is None:
+        return search(array, key)
+    indices = np.flatnonzero(np.asarray(array) == key)
+    return int(indices[0]) if len(indices) else -1
+
+
 assert search([1, 2, 3, 4], 3) == 2
 assert search([10, 8, 30, 4, 5], 5) == 4
 assert search([10, 8, 30], 6) == -1
+
+assert search_vectorized([1, 2, 3, 4], 3) == 2
+assert search_vectorized([10, 8, 30, 4, 5], 5) == 4
+assert search_vectorized([10, 8, 30], 6) == -1
@@ -1,6 +1,14 @@
+import sys
+
 import pytest
 
-from dsa.arrays import StaticArray, DynamicArray
+from dsa.arrays import (
+    ArrayView,
+    DynamicArray,
+    SortedArray,
+    StaticArray,
+    TieredArray,
+)
 
 
 def test_static_array_initialization():
@@ -117,3 +125,534 @@ def test_dynamic_array_clear():
     array.clear()
     for i in range(array.size()):
         assert array.get(i) is None
+
+
+def test_dynamic_array_empty_initialization():
+    array = DynamicArray()
+    assert array.size() == 0
+    assert array.capacity == 1
+    with pytest.raises(IndexError):
+        array.get(0)
+    with pytest.raises(ValueError):
+        DynamicArray(-1)
+    with pytest.raises(ValueError):
+        DynamicArray(growth_factor=1)
+
+
+def test_dynamic_array_geometric_growth():
+    array = DynamicArray()
+    capacities = set()
+    for i in range(100):
+        array.append(i)
+        capacities.add(array.capacity)
+    assert array.size() == 100
+    assert [array.get(i) for i in range(100)] == list(range(100))
+    assert capacities == {1, 2, 4, 8, 16, 32, 64, 128}
+
+
+def test_dynamic_array_growth_factor():
+    array = DynamicArray(growth_factor=1.5)
+    for i in range(10):
+        array.append(i)
+    assert array.capacity >= 10
+    assert [array.get(i) for i in range(10)] == list(range(10))
+
+
+def test_dynamic_array_reserve_and_shrink_to_fit():
+    array = DynamicArray(2)
+    array.set(0, "a")
+    array.set(1, "b")
+    array.reserve(50)
+    assert array.capacity == 50
+    assert array.size() == 2
+    array.reserve(10)  # Never shrinks
+    assert array.capacity == 50
+    array.shrink_to_fit()
+    assert array.capacity == 2
+    assert array.get(0) == "a"
+    assert array.get(1) == "b"
+
+
+def test_dynamic_array_ignores_spare_capacity():
+    array = DynamicArray(1)
+    array.set(0, 1)
+    array.reserve(10)
+    assert array.contains(None) is False
+    with pytest.raises(IndexError):
+        array.get(1)
+    with pytest.raises(IndexError):
+        array.set(1, 2)
+
+
+def test_typed_static_array_initialization():
+    array = StaticArray(4, typecode="q")
+    assert array.size() == 4
+    assert [array.get(i) for i in range(4)] == [0, 0, 0, 0]
+    assert array.array.itemsize == 8
+
+
+def test_typed_static_array_get_set_clear():
+    array = StaticArray(3, typecode="d")
+    array.set(0, 1.5)
+    array.set(2, -2.0)
+    assert array.get(0) == 1.5
+    assert array.contains(-2.0) is True
+    with pytest.raises(TypeError):
+        array.set(1, "x")
+    array.clear()
+    assert [array.get(i) for i in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_typed_static_array_memoryview():
+    array = StaticArray(5, typecode="i")
+    for i in range(5):
+        array.set(i, i * 10)
+    view = array.as_memoryview(1, 4)
+    assert view.tolist() == [10, 20, 30]
+    view[0] = 99  # Writes through to the array
+    assert array.get(1) == 99
+    assert bytes(array.as_memoryview()) == array.array.tobytes()
+
+
+def test_static_array_memoryview_shares_memory_with_numpy():
+    np = pytest.importorskip("numpy")
+    array = StaticArray(4, typecode="q")
+    shared = np.asarray(array.as_memoryview())
+    array.set(2, 7)
+    assert shared[2] == 7
+    assert np.shares_memory(shared, np.frombuffer(array.array, dtype="q"))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="requires PEP 688")
+def test_static_array_buffer_protocol():
+    array = StaticArray(4, typecode="q")
+    view = memoryview(array)
+    array.set(1, 5)
+    assert view.tolist() == [0, 5, 0, 0]
+
+
+def test_untyped_static_array_memoryview():
+    array = StaticArray(2)
+    with pytest.raises(TypeError):
+        array.as_memoryview()
+
+
+def test_typed_dynamic_array():
+    array = DynamicArray(typecode="q")
+    for i in range(10):
+        array.append(i)
+    assert array.array.typecode == "q"
+    assert [array.get(i) for i in range(10)] == list(range(10))
+    array.delete(0)
+    array.clear()
+    assert [array.get(i) for i in range(9)] == [0] * 9
+
+
+def test_dynamic_array_extend():
+    array = DynamicArray(1)
+    array.set(0, 0)
+    array.extend(range(1, 6))
+    assert array.size() == 6
+    assert [array.get(i) for i in range(6)] == [0, 1, 2, 3, 4, 5]
+    array.extend([])
+    assert array.size() == 6
+
+
+def test_dynamic_array_insert_many():
+    array = DynamicArray()
+    array.extend(["a", "e"])
+    array.insert_many(1, ["b", "c", "d"])
+    assert [array.get(i) for i in range(5)] == ["a", "b", "c", "d", "e"]
+    array.reserve(20)
+    array.insert_many(0, iter(["x", "y"]))  # Fits in spare capacity
+    assert array.capacity == 20
+    assert [array.get(i) for i in range(7)] == ["x", "y", "a", "b", "c", "d", "e"]
+    with pytest.raises(IndexError):
+        array.insert_many(8, ["z"])
+
+
+def test_dynamic_array_delete_range():
+    array = DynamicArray()
+    array.extend(range(10))
+    array.delete_range(2, 5)
+    assert array.size() == 7
+    assert [array.get(i) for i in range(7)] == [0, 1, 5, 6, 7, 8, 9]
+    # Vacated slots are cleared
+    assert array.array.array.count(None) == array.capacity - array.size()
+    array.delete_range(3, 3)
+    assert array.size() == 7
+    array.delete_range(0, 7)
+    assert array.size() == 0
+    with pytest.raises(IndexError):
+        array.delete_range(0, 1)
+    with pytest.raises(IndexError):
+        array.delete_range(1, 0)
+
+
+def test_file_backed_static_array(tmp_path):
+    path = tmp_path / "array.bin"
+    array = StaticArray.open(path, 4, typecode="q")
+    assert array.size() == 4
+    assert [array.get(i) for i in range(4)] == [0, 0, 0, 0]
+    array.set(1, 7)
+    array.set(3, -1)
+    assert array.contains(7) is True
+    with pytest.raises(IndexError):
+        array.get(4)
+    array.flush()
+    array.close()
+    assert path.stat().st_size == 32
+
+    reopened = StaticArray.open(path, typecode="q", readonly=True)
+    assert reopened.size() == 4
+    assert [reopened.get(i) for i in range(4)] == [0, 7, 0, -1]
+    assert reopened.as_memoryview(1, 2).tolist() == [7]
+    with pytest.raises(TypeError):
+        reopened.set(0, 1)
+    reopened.close()
+
+
+def test_file_backed_static_array_shared(tmp_path):
+    path = tmp_path / "array.bin"
+    writer = StaticArray.open(path, 3, typecode="d")
+    reader = StaticArray.open(path, typecode="d")
+    writer.set(2, 2.5)
+    assert reader.get(2) == 2.5  # Both map the same pages
+    writer.close()
+    reader.close()
+
+
+def test_file_backed_static_array_invalid(tmp_path):
+    path = tmp_path / "array.bin"
+    with pytest.raises(ValueError):
+        StaticArray.open(path, 0)
+    path.write_bytes(bytes(8))
+    with pytest.raises(ValueError):
+        StaticArray.open(path, 2, typecode="q", readonly=True)
+
+
+def test_dynamic_array_insert_front_wraps_around():
+    array = DynamicArray()
+    array.reserve(4)
+    array.append(3)
+    array.insert(2)
+    array.insert(1)
+    array.insert(0)
+    assert array.capacity == 4  # Filled from the back of the buffer
+    assert [array.get(i) for i in range(4)] == [0, 1, 2, 3]
+    array.insert(-1)
+    assert array.capacity == 8
+    assert [array.get(i) for i in range(5)] == [-1, 0, 1, 2, 3]
+
+
+def test_dynamic_array_deque_operations():
+    array = DynamicArray()
+    expected = []
+    for i in range(50):
+        if i % 3 == 0:
+            array.insert(i)
+            expected.insert(0, i)
+        else:
+            array.append(i)
+            expected.append(i)
+        if i % 7 == 0:
+            array.delete(0)
+            expected.pop(0)
+        if i % 11 == 0 and expected:
+            array.delete(array.size() - 1)
+            expected.pop()
+    assert [array.get(i) for i in range(array.size())] == expected
+    array.set(0, "first")
+    assert array.get(0) == "first"
+    assert array.contains(expected[-1]) is True
+
+
+def test_dynamic_array_bulk_operations_wrap_around():
+    array = DynamicArray()
+    array.reserve(8)
+    array.extend([4, 5, 6])
+    for value in [3, 2, 1]:
+        array.insert(value)  # Head now wraps to the end of the buffer
+    array.insert_many(1, ["a", "b"])
+    assert [array.get(i) for i in range(8)] == [1, "a", "b", 2, 3, 4, 5, 6]
+    array.delete_range(4, 7)
+    assert [array.get(i) for i in range(5)] == [1, "a", "b", 2, 6]
+    array.delete_range(0, 2)
+    assert [array.get(i) for i in range(3)] == ["b", 2, 6]
+    array.shrink_to_fit()
+    assert array.capacity == 3
+    assert [array.get(i) for i in range(3)] == ["b", 2, 6]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_static_array_search(typecode):
+    array = StaticArray(6, typecode=typecode)
+    for i, value in enumerate([3, 1, 3, 2, 3, 1]):
+        array.set(i, value)
+    assert array.contains(2) is True
+    assert array.contains(4) is False
+    assert array.index(3) == 0
+    assert array.index(3, 1) == 2
+    assert array.index(1, 2, 6) == 5
+    with pytest.raises(ValueError):
+        array.index(2, 4)
+    assert array.count(3) == 3
+    assert array.count(3, 1, 4) == 1
+    assert array.find_all(3) == [0, 2, 4]
+    assert array.find_all(1, 2) == [5]
+    assert array.find_all(4) == []
+    with pytest.raises(IndexError):
+        array.count(3, 4, 2)
+
+
+def test_typed_static_array_search_non_numeric_value():
+    array = StaticArray(3, typecode="d")
+    array.set(1, 2.5)
+    assert array.contains("2.5") is False
+    assert array.index(2.5) == 1
+    assert array.count(2) == 0
+
+
+@pytest.mark.parametrize(
+    "typecode, values",
+    [("i", [5, 3, 6]), ("f", [0.1, 0.5, 3.0]), ("d", [0.1, 0.5, 3.0])],
+)
+def test_static_array_vectorized_search_matches_fallback(
+    monkeypatch, typecode, values
+):
+    pytest.importorskip("numpy")
+    import dsa.arrays
+
+    array = StaticArray(1000, typecode=typecode)
+    for i in range(1000):
+        array.set(i, values[i % 3] if i % 7 == 0 else i % 7)
+
+    def search():
+        return [
+            (array.contains(v), array.count(v), array.find_all(v, 900))
+            for v in values + [float("nan"), float("inf"), -float("inf")]
+        ]
+
+    vectorized = search()
+    monkeypatch.setattr(dsa.arrays, "np", None)
+    assert vectorized == search()
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_dynamic_array_search_wraps_around(typecode):
+    array = DynamicArray(typecode=typecode)
+    array.reserve(8)
+    array.extend([4, 5, 6, 1])
+    for value in [3, 1, 1]:
+        array.insert(value)  # Elements 0-2 live at the end of the buffer
+    assert [array.get(i) for i in range(7)] == [1, 1, 3, 4, 5, 6, 1]
+    assert array.contains(6) is True
+    assert array.contains(7) is False
+    assert array.index(1) == 0
+    assert array.index(1, 2) == 6
+    assert array.index(4, 1, 5) == 3
+    with pytest.raises(ValueError):
+        array.index(3, 3)
+    assert array.count(1) == 3
+    assert array.find_all(1) == [0, 1, 6]
+    assert array.find_all(1, 1, 6) == [1]
+    with pytest.raises(IndexError):
+        array.find_all(1, 0, 8)
+
+
+@pytest.fixture
+def sorted_array():
+    return SortedArray([50, 30, 70, 20, 40, 60, 80, 30])
+
+
+def test_sorted_array_initialization(sorted_array):
+    assert sorted_array.size() == 7
+    assert [sorted_array.get(i) for i in range(7)] == [20, 30, 40, 50, 60, 70, 80]
+    assert SortedArray().size() == 0
+
+
+def test_sorted_array_lookup(sorted_array):
+    assert sorted_array.contains(40) is True
+    assert sorted_array.contains(45) is False
+    assert sorted_array.index(70) == 5
+    with pytest.raises(ValueError):
+        sorted_array.index(10)
+    assert sorted_array.rank(20) == 0
+    assert sorted_array.rank(45) == 3
+    assert sorted_array.rank(100) == 7
+
+
+def test_sorted_array_count_range(sorted_array):
+    assert sorted_array.count_range(30, 60) == 4
+    assert sorted_array.count_range(31, 59) == 2
+    assert sorted_array.count_range(0, 100) == 7
+    assert sorted_array.count_range(60, 30) == 0
+
+
+def test_sorted_array_insert_delete(sorted_array):
+    sorted_array.insert(45)
+    sorted_array.insert(10)
+    sorted_array.insert(45)  # Duplicate
+    assert [sorted_array.get(i) for i in range(9)] == [
+        10, 20, 30, 40, 45, 50, 60, 70, 80
+    ]
+    sorted_array.delete(50)
+    sorted_array.delete(55)  # Missing
+    assert sorted_array.size() == 8
+    assert sorted_array.contains(50) is False
+
+
+def test_sorted_array_merge(sorted_array):
+    sorted_array.merge(iter([10, 30, 35, 35, 90]))
+    assert [sorted_array.get(i) for i in range(sorted_array.size())] == [
+        10, 20, 30, 35, 40, 50, 60, 70, 80, 90
+    ]
+    with pytest.raises(ValueError):
+        sorted_array.merge([5, 1])
+    assert sorted_array.size() == 10
+
+
+def test_typed_sorted_array():
+    array = SortedArray(range(10, 0, -1), typecode="q")
+    assert array.array.array.typecode == "q"
+    assert array.rank(5) == 4
+    assert array.count_range(3, 6) == 4
+
+
+def test_static_array_slice_view():
+    array = StaticArray(10)
+    for i in range(10):
+        array[i] = i
+    view = array[2:8:2]
+    assert isinstance(view, ArrayView)
+    assert len(view) == 3
+    assert list(view) == [2, 4, 6]
+    assert view.get(1) == 4
+    assert view.contains(6) is True
+    assert view.contains(3) is False
+    with pytest.raises(IndexError):
+        view.get(3)
+
+
+def test_array_view_writes_through():
+    array = StaticArray(5, typecode="q")
+    view = array[1:4]
+    view.set(0, 10)
+    view[2] = 30
+    assert list(array) == [0, 10, 0, 30, 0]
+    assert view.contains(30) is True
+    assert view.contains(0) is True
+    assert array[::2].contains(10) is False
+
+
+def test_array_view_of_view():
+    array = StaticArray(10)
+    for i in range(10):
+        array.set(i, i)
+    view = array[1:9][::3]
+    assert view.parent is array
+    assert list(view) == [1, 4, 7]
+    assert list(array[::-1][2:5]) == [7, 6, 5]
+    assert array[::-1][2:5].contains(5) is True
+    assert list(array[5:2]) == []
+
+
+def test_array_view_copy():
+    array = StaticArray(6, typecode="i")
+    for i in range(6):
+        array.set(i, i * i)
+    copy = array[1::2].copy()
+    assert isinstance(copy, DynamicArray)
+    assert copy.typecode == "i"
+    assert list(copy) == [1, 9, 25]
+    copy.set(0, -1)
+    assert array.get(1) == 1  # Copies do not share storage
+
+
+def test_dynamic_array_slice_view():
+    array = DynamicArray()
+    array.extend(range(5))
+    view = array[1:4]
+    assert list(view) == [1, 2, 3]
+    array.insert(-1)  # Views index the array by position
+    assert list(view) == [0, 1, 2]
+    view.set(0, "x")
+    assert array.get(1) == "x"
+    assert array[2] == 1
+
+
+def test_dynamic_array_insert_at_index():
+    array = DynamicArray()
+    array.extend(["a", "c", "d"])
+    array.insert("b", 1)
+    array.insert("e", 4)
+    assert list(array) == ["a", "b", "c", "d", "e"]
+    with pytest.raises(IndexError):
+        array.insert("x", 6)
+
+
+def test_tiered_array_initialization():
+    array = TieredArray(3)
+    assert array.size() == 3
+    assert list(array) == [None, None, None]
+    assert list(TieredArray(2, typecode="q")) == [0, 0]
+    with pytest.raises(ValueError):
+        TieredArray(-1)
+    with pytest.raises(ValueError):
+        TieredArray(block_size=0)
+
+
+def test_tiered_array_get_set():
+    array = TieredArray(10, block_size=3)
+    for i in range(10):
+        array.set(i, i)
+    assert [array.get(i) for i in range(10)] == list(range(10))
+    assert array.contains(9) is True
+    assert array.contains(10) is False
+    with pytest.raises(IndexError):
+        array.get(10)
+    with pytest.raises(IndexError):
+        array.set(-1, 0)
+    array.clear()
+    assert list(array) == [None] * 10
+
+
+def test_tiered_array_insert_delete():
+    array = TieredArray(block_size=3)
+    for value in "bdf":
+        array.append(value)
+    array.insert("a")
+    array.insert("c", 2)
+    array.insert("e", 4)
+    array.insert("g", 6)
+    assert list(array) == list("abcdefg")
+    assert array.blocks.size() == 3
+    array.delete(0)
+    array.delete(3)
+    assert list(array) == list("bcdfg")
+    array.delete(4)
+    array.delete(3)
+    assert list(array) == list("bcd")
+    assert array.blocks.size() == 1  # Empty blocks are released
+    with pytest.raises(IndexError):
+        array.delete(3)
+    with pytest.raises(IndexError):
+        array.insert("x", 5)
+
+
+def test_tiered_array_matches_list():
+    array = TieredArray()
+    expected = []
+    for i in range(2000):
+        index = (i * 7919) % (len(expected) + 1)
+        array.insert(i, index)
+        expected.insert(index, i)
+    assert array.block_size == 64  # Grown to stay close to √n
+    assert list(array) == expected
+    for i in range(1900):
+        index = (i * 104729) % len(expected)
+        array.delete(index)
+        del expected[index]
+    assert array.block_size < 64
+    assert list(array) == expected
+    assert [array.get(i) for i in range(len(expected))] == expected
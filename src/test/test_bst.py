@@ -1,12 +1,12 @@
 import pytest
 
-from dsa.bst import BinarySearchTree
+from dsa.bst import AVLTree, BinarySearchTree, Node, PersistentAVLTree, size
 
 
-@pytest.fixture
-def bst():
+@pytest.fixture(params=[BinarySearchTree, AVLTree, PersistentAVLTree])
+def bst(request):
     """Fixture to create a BST with predefined nodes for testing."""
-    tree = BinarySearchTree()
+    tree = request.param()
     for key in [50, 30, 70, 20, 40, 60, 80]:
         tree.insert(key)
     return tree
@@ -68,3 +68,275 @@ def test_delete_root_node():
     bst.delete(10)
     assert bst.search(10) is None
     assert bst.inorder() == [5, 15]
+
+
+def assert_avl(node: Node | None) -> int:
+    """Checks the AVL invariants below `node` and returns its height."""
+    if node is None:
+        return 0
+    left = assert_avl(node.left)
+    right = assert_avl(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    assert node.size == 1 + size(node.left) + size(node.right)
+    return node.height
+
+
+def test_delete_root_node_with_one_child():
+    bst = BinarySearchTree()
+    bst.insert(10)
+    bst.insert(5)
+    bst.delete(10)
+    assert bst.root.key == 5
+    assert bst.inorder() == [5]
+
+
+def test_avl_sorted_insert():
+    avl = AVLTree()
+    for key in range(5000):
+        avl.insert(key)
+    assert avl.inorder() == list(range(5000))
+    assert avl.height <= 14  # 1.44 * log2(5000)
+    assert_avl(avl.root)
+
+
+def test_avl_rotations():
+    avl = AVLTree()
+    for key in [30, 10, 20]:  # Left-right case
+        avl.insert(key)
+    assert avl.preorder() == [20, 10, 30]
+    for key in [40, 50]:  # Right-right case
+        avl.insert(key)
+    assert avl.preorder() == [20, 10, 40, 30, 50]
+    assert_avl(avl.root)
+
+
+def test_avl_delete():
+    avl = AVLTree()
+    keys = [(i * 37) % 1000 for i in range(1000)]
+    for key in keys:
+        avl.insert(key)
+    for key in keys[::2]:
+        avl.delete(key)
+        assert avl.search(key) is None
+    assert avl.inorder() == sorted(keys[1::2])
+    assert_avl(avl.root)
+    for key in keys[1::2]:
+        avl.delete(key)
+    assert avl.root is None
+    assert avl.height == 0
+
+
+def test_lazy_traversals(bst):
+    iterator = bst.iter_inorder()
+    assert next(iterator) == 20
+    assert next(iterator) == 30
+    assert list(bst) == [20, 30, 40, 50, 60, 70, 80]
+    assert list(bst.iter_preorder()) == bst.preorder()
+    assert list(bst.iter_postorder()) == bst.postorder()
+
+
+def test_empty_traversals():
+    bst = BinarySearchTree()
+    assert bst.preorder() == []
+    assert bst.inorder() == []
+    assert bst.postorder() == []
+    assert list(bst) == []
+
+
+def test_deep_unbalanced_tree():
+    bst = BinarySearchTree()
+    n = 2000  # Deeper than the default recursion limit
+    for key in range(n):
+        bst.insert(key)
+    assert bst.height == n
+    assert bst.search(n - 1).key == n - 1
+    assert list(bst) == list(range(n))
+    assert bst.postorder() == list(range(n - 1, -1, -1))
+    for key in range(0, n, 2):
+        bst.delete(key)
+    assert bst.inorder() == list(range(1, n, 2))
+
+
+def test_size(bst):
+    assert bst.size == 7
+    bst.insert(25)
+    bst.insert(25)  # Duplicate
+    assert bst.size == 8
+    bst.delete(50)
+    bst.delete(99)  # Missing
+    assert bst.size == 7
+    assert BinarySearchTree().size == 0
+
+
+def test_rank(bst):
+    assert bst.rank(20) == 0
+    assert bst.rank(50) == 3
+    assert bst.rank(55) == 4
+    assert bst.rank(100) == 7
+    bst.delete(30)
+    assert bst.rank(50) == 2
+
+
+def test_select(bst):
+    assert [bst.select(k) for k in range(7)] == [20, 30, 40, 50, 60, 70, 80]
+    with pytest.raises(IndexError):
+        bst.select(7)
+    with pytest.raises(IndexError):
+        bst.select(-1)
+    bst.delete(20)
+    bst.insert(65)
+    assert bst.select(0) == 30
+    assert bst.select(4) == 65
+
+
+def test_count_range(bst):
+    assert bst.count_range(30, 60) == 4
+    assert bst.count_range(31, 59) == 2
+    assert bst.count_range(0, 100) == 7
+    assert bst.count_range(60, 30) == 0
+    assert bst.count_range(80, 80) == 1
+
+
+def test_avl_order_statistics():
+    avl = AVLTree()
+    keys = [(i * 37) % 1000 for i in range(1000)]
+    for key in keys:
+        avl.insert(key)
+    for key in keys[::3]:
+        avl.delete(key)
+    remaining = sorted(set(keys) - set(keys[::3]))
+    assert_avl(avl.root)
+    assert avl.size == len(remaining)
+    assert [avl.select(k) for k in range(avl.size)] == remaining
+    assert all(avl.rank(key) == k for k, key in enumerate(remaining))
+    assert avl.count_range(100, 199) == sum(100 <= key <= 199 for key in remaining)
+
+
+@pytest.mark.parametrize("cls", [BinarySearchTree, AVLTree, PersistentAVLTree])
+def test_from_sorted(cls):
+    tree = cls.from_sorted(iter([1, 2, 2, 3, 4, 5, 6, 7]))
+    assert isinstance(tree, cls)
+    assert tree.preorder() == [4, 2, 1, 3, 6, 5, 7]
+    assert tree.size == 7
+    assert_avl(tree.root)
+
+    tree = cls.from_sorted(range(10000))
+    assert tree.height == 14
+    assert tree.select(1234) == 1234
+    assert_avl(tree.root)
+
+    assert cls.from_sorted([]).root is None
+    with pytest.raises(ValueError):
+        cls.from_sorted([1, 3, 2])
+
+
+def test_merge(bst):
+    other = BinarySearchTree()
+    for key in [10, 40, 90, 55]:
+        other.insert(key)
+    bst.merge(other)
+    assert bst.inorder() == [10, 20, 30, 40, 50, 55, 60, 70, 80, 90]
+    assert bst.size == 10
+    assert_avl(bst.root)
+    assert other.inorder() == [10, 40, 55, 90]  # Unchanged
+    bst.merge(BinarySearchTree())
+    assert bst.size == 10
+
+
+def test_min_max(bst):
+    assert bst.min() == 20
+    assert bst.max() == 80
+    bst.delete(20)
+    bst.delete(80)
+    assert bst.min() == 30
+    assert bst.max() == 70
+    empty = BinarySearchTree()
+    assert empty.min() is None
+    assert empty.max() is None
+
+
+def test_floor_ceiling(bst):
+    assert bst.floor(50) == 50
+    assert bst.floor(55) == 50
+    assert bst.floor(10) is None
+    assert bst.ceiling(50) == 50
+    assert bst.ceiling(55) == 60
+    assert bst.ceiling(90) is None
+
+
+def test_predecessor_successor(bst):
+    assert bst.predecessor(50) == 40
+    assert bst.predecessor(55) == 50
+    assert bst.predecessor(20) is None
+    assert bst.successor(50) == 60
+    assert bst.successor(45) == 50
+    assert bst.successor(80) is None
+
+
+def test_range(bst):
+    assert list(bst.range(30, 60)) == [30, 40, 50, 60]
+    assert list(bst.range(25, 65)) == [30, 40, 50, 60]
+    assert list(bst.range(0, 100)) == [20, 30, 40, 50, 60, 70, 80]
+    assert list(bst.range(81, 100)) == []
+    assert list(bst.range(60, 30)) == []
+    assert list(BinarySearchTree().range(0, 1)) == []
+
+
+def test_range_is_lazy():
+    tree = AVLTree.from_sorted(range(100000))
+    window = tree.range(500, 10**9)
+    assert [next(window) for _ in range(3)] == [500, 501, 502]
+
+
+def nodes(root: Node | None) -> dict[int, tuple]:
+    """Returns the state of every node reachable from `root` by id."""
+    state = {}
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        state[id(node)] = (node.key, node.left, node.right, node.height, node.size)
+        stack.extend(child for child in (node.left, node.right) if child)
+    return state
+
+
+def test_persistent_snapshot_is_unchanged():
+    tree = PersistentAVLTree()
+    for key in range(0, 200, 2):
+        tree.insert(key)
+    snapshot = tree.snapshot()
+    before = nodes(snapshot.root)
+
+    for key in range(1, 200, 4):
+        tree.insert(key)
+    for key in range(0, 200, 6):
+        tree.delete(key)
+
+    assert nodes(snapshot.root) == before
+    assert snapshot.inorder() == list(range(0, 200, 2))
+    expected = sorted(set(range(0, 200, 2)) | set(range(1, 200, 4)))
+    expected = [key for key in expected if key % 6]
+    assert tree.inorder() == expected
+    assert_avl(tree.root)
+
+
+def test_persistent_insert_copies_path():
+    tree = PersistentAVLTree.from_sorted(range(1023))
+    old_root = tree.root
+    new_root = tree.insert(2000)
+    assert new_root is tree.root
+    assert new_root is not old_root
+    new_nodes = nodes(new_root).keys() - nodes(old_root).keys()
+    assert len(new_nodes) <= 2 * tree.height
+    assert tree.delete(3000) is tree.root  # Missing keys change nothing
+    assert tree.root is new_root
+
+
+def test_persistent_snapshots_are_independent():
+    tree = PersistentAVLTree()
+    tree.insert(1)
+    snapshot = tree.snapshot()
+    snapshot.insert(2)
+    tree.insert(3)
+    assert snapshot.inorder() == [1, 2]
+    assert tree.inorder() == [1, 3]
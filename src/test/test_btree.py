@@ -0,0 +1,169 @@
+import random
+
+import pytest
+
+from dsa.btree import BTree, BTreeNode
+
+
+@pytest.fixture(params=[4, 64])
+def btree(request):
+    """Fixture to create a B-tree with predefined keys for testing."""
+    tree = BTree(order=request.param)
+    for key in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(key)
+    return tree
+
+
+def assert_btree(tree: BTree) -> None:
+    """Checks the B-tree invariants of `tree`."""
+    t = tree.order // 2
+    leaf_depths = set()
+    stack: list[tuple[BTreeNode, int, object, object]] = []
+    if tree.root is not None:
+        stack.append((tree.root, 1, None, None))
+    while stack:
+        node, depth, lo, hi = stack.pop()
+        assert node.keys == sorted(node.keys)
+        assert len(node.keys) <= tree.order - 1
+        if node is not tree.root:
+            assert len(node.keys) >= t - 1
+        assert all(lo is None or key > lo for key in node.keys)
+        assert all(hi is None or key < hi for key in node.keys)
+        assert node.size == len(node.keys) + sum(c.size for c in node.children)
+        if node.leaf:
+            leaf_depths.add(depth)
+        else:
+            assert len(node.children) == len(node.keys) + 1
+            bounds = [lo] + node.keys + [hi]
+            for i, child in enumerate(node.children):
+                stack.append((child, depth + 1, bounds[i], bounds[i + 1]))
+    assert len(leaf_depths) <= 1
+
+
+def test_invalid_order():
+    with pytest.raises(ValueError):
+        BTree(order=2)
+    with pytest.raises(ValueError):
+        BTree(order=5)
+
+
+def test_insert_search(btree):
+    btree.insert(25)
+    btree.insert(25)  # Duplicate
+    match = btree.search(25)
+    assert match is not None
+    assert match.key == 25
+    assert match.node.keys[match.index] == 25
+    assert btree.search(100) is None
+    assert btree.size == 8
+    assert_btree(btree)
+
+
+def test_search_key_matches_bst_api():
+    btree = BTree(order=4)
+    for key in range(100):
+        btree.insert(key)
+    for key in range(100):
+        assert btree.search(key).key == key
+    assert btree.search(-1) is None
+
+
+def test_delete(btree):
+    btree.delete(20)
+    btree.delete(70)
+    btree.delete(99)  # Missing
+    assert btree.search(20) is None
+    assert btree.inorder() == [30, 40, 50, 60, 80]
+    for key in [30, 40, 50, 60, 80]:
+        btree.delete(key)
+    assert btree.root is None
+    assert btree.size == 0
+
+
+def test_traversals():
+    tree = BTree(order=4)
+    for key in range(1, 8):
+        tree.insert(key)
+    assert tree.inorder() == [1, 2, 3, 4, 5, 6, 7]
+    assert tree.preorder() == [2, 4, 1, 3, 5, 6, 7]
+    assert tree.postorder() == [1, 3, 5, 6, 7, 2, 4]
+    assert list(tree) == tree.inorder()
+    assert BTree().inorder() == []
+
+
+def test_ordered_queries(btree):
+    assert btree.min() == 20
+    assert btree.max() == 80
+    assert btree.floor(55) == 50
+    assert btree.floor(50) == 50
+    assert btree.floor(10) is None
+    assert btree.ceiling(55) == 60
+    assert btree.ceiling(90) is None
+    assert btree.predecessor(50) == 40
+    assert btree.successor(50) == 60
+    assert btree.successor(80) is None
+    assert list(btree.range(25, 65)) == [30, 40, 50, 60]
+    assert list(btree.range(81, 90)) == []
+    assert BTree().min() is None
+
+
+def test_order_statistics(btree):
+    assert btree.rank(50) == 3
+    assert btree.rank(55) == 4
+    assert [btree.select(k) for k in range(7)] == [20, 30, 40, 50, 60, 70, 80]
+    with pytest.raises(IndexError):
+        btree.select(7)
+    assert btree.count_range(30, 60) == 4
+    assert btree.count_range(60, 30) == 0
+
+
+@pytest.mark.parametrize("order", [4, 6, 32])
+def test_matches_sorted_set(order):
+    rng = random.Random(order)
+    tree = BTree(order=order)
+    expected: set[int] = set()
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if rng.random() < 0.6:
+            tree.insert(key)
+            expected.add(key)
+        else:
+            tree.delete(key)
+            expected.discard(key)
+    assert_btree(tree)
+    keys = sorted(expected)
+    assert tree.inorder() == keys
+    assert tree.size == len(keys)
+    assert [tree.select(k) for k in range(len(keys))] == keys
+    assert all(tree.rank(key) == k for k, key in enumerate(keys))
+    assert list(tree.range(100, 200)) == [key for key in keys if 100 <= key <= 200]
+
+
+@pytest.mark.parametrize("order", [4, 64])
+def test_from_sorted(order):
+    tree = BTree.from_sorted(iter([1, 2, 2, 3]), order=order)
+    assert tree.inorder() == [1, 2, 3]
+    tree = BTree.from_sorted(range(10000), order=order)
+    assert_btree(tree)
+    assert tree.size == 10000
+    assert tree.select(1234) == 1234
+    tree.insert(-1)
+    tree.delete(5000)
+    assert_btree(tree)
+    assert BTree.from_sorted([]).root is None
+    with pytest.raises(ValueError):
+        BTree.from_sorted([1, 3, 2])
+
+
+def test_merge(btree):
+    other = BTree(order=4)
+    for key in [10, 40, 90, 55]:
+        other.insert(key)
+    btree.merge(other)
+    assert btree.inorder() == [10, 20, 30, 40, 50, 55, 60, 70, 80, 90]
+    assert_btree(btree)
+
+
+def test_shallow_tree():
+    tree = BTree.from_sorted(range(100000), order=64)
+    assert tree.height <= 4
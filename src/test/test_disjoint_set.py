@@ -1,6 +1,6 @@
 import pytest
 
-from dsa.disjoint_set import DisjointSet
+from dsa.disjoint_set import DisjointSet, parallel_components
 
 
 @pytest.fixture
@@ -79,3 +79,348 @@ def test_large_union():
         ds.union(i, i + 1)
 
     assert ds.find(0) == ds.find(999)
+
+
+def test_range_initialization():
+    ds = DisjointSet.range(5)
+    assert [ds.find(i) for i in range(5)] == [0, 1, 2, 3, 4]
+    assert ds._element_map is None
+    assert ds._array.typecode == "i"
+
+
+def test_range_union():
+    ds = DisjointSet.range(6)
+    ds.union(0, 1)
+    ds.union(2, 3)
+    ds.union(1, 3)
+    assert ds.find(0) == ds.find(2)
+    assert ds.find(4) != ds.find(0)
+    assert ds.find(5) == 5
+
+
+def test_range_nonexistent_element():
+    ds = DisjointSet.range(3)
+    with pytest.raises(ValueError):
+        ds.find(3)
+    with pytest.raises(ValueError):
+        ds.find(-1)
+    with pytest.raises(ValueError):
+        ds.union(0, "a")
+    with pytest.raises(ValueError):
+        ds.union(0, 3)
+    with pytest.raises(ValueError):
+        DisjointSet.range(-1)
+
+
+def test_range_integer_like_elements():
+    ds = DisjointSet.range(3)
+    ds.union(True, 2)  # Integer-like elements are converted to indices
+    assert ds.find(2) == ds.find(1)
+    assert isinstance(ds.find(True), int)
+
+
+def test_range_large_union():
+    ds = DisjointSet.range(1000)
+    for i in range(0, 999):
+        ds.union(i, i + 1)
+    assert ds.find(0) == ds.find(999)
+
+
+def test_union_many(disjoint_set):
+    disjoint_set.union_many([("a", "b"), ("c", "d"), ("b", "c")])
+    assert disjoint_set.find("a") == disjoint_set.find("d")
+    assert disjoint_set.find("e") == "e"
+    with pytest.raises(ValueError):
+        disjoint_set.union_many([("a", "z")])
+
+
+def test_find_many(disjoint_set):
+    disjoint_set.union("a", "b")
+    labels = disjoint_set.find_many(["a", "b", "c"])
+    assert labels[0] == labels[1]
+    assert labels[2] == "c"
+
+
+def test_range_union_many_pairs():
+    ds = DisjointSet.range(6)
+    ds.union_many([(0, 1), (2, 3), (1, 3)])
+    assert ds.find_many(range(6)) == [ds.find(0)] * 4 + [4, 5]
+
+
+def test_range_union_many_vectorized():
+    np = pytest.importorskip("numpy")
+    ds = DisjointSet.range(10)
+    ds.union(8, 9)
+    ds.union_many(np.array([[1, 5], [5, 3], [7, 0], [9, 2], [3, 3]]))
+    labels = ds.find_many(np.arange(10))
+    assert isinstance(labels, np.ndarray)
+    assert len({labels[i] for i in [1, 3, 5]}) == 1
+    assert len({labels[i] for i in [2, 8, 9]}) == 1
+    assert labels[0] == labels[7]
+    assert labels[4] == 4 and labels[6] == 6
+    assert len(set(labels.tolist())) == 5
+    # Scalar operations keep working on the bulk-updated forest.
+    ds.union(4, 6)
+    assert ds.find(4) == ds.find(6)
+    assert ds._size[ds.find(9)] == 3
+
+
+def test_range_union_many_matches_loop():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    edges = rng.integers(0, 2000, size=(1500, 2))
+    bulk = DisjointSet.range(2000)
+    bulk.union_many(edges)
+    loop = DisjointSet.range(2000)
+    for u, v in edges.tolist():
+        loop.union(u, v)
+    labels = bulk.find_many(np.arange(2000))
+    expected = [loop.find(i) for i in range(2000)]
+    # Same partition, possibly with different representatives.
+    assert len(set(zip(labels.tolist(), expected))) == len(set(expected))
+    assert len(set(labels.tolist())) == len(set(expected))
+
+
+def test_range_small_batches_use_loops():
+    np = pytest.importorskip("numpy")
+    ds = DisjointSet.range(1000)
+    ds.union_many(np.array([[1, 2], [2, 3]]))
+    assert ds.num_components == 998
+    assert ds.component_size(3) == 3
+    labels = ds.find_many(np.array([[1, 3], [4, 5]]))
+    assert isinstance(labels, np.ndarray)
+    assert labels.shape == (2, 2)
+    assert labels[0, 0] == labels[0, 1] == ds.find(2)
+    assert labels[1].tolist() == [4, 5]
+    with pytest.raises(ValueError):
+        ds.union_many(np.array([[0, 1000]]))
+
+
+def test_range_union_many_invalid():
+    np = pytest.importorskip("numpy")
+    ds = DisjointSet.range(3)
+    with pytest.raises(ValueError):
+        ds.union_many(np.array([[0, 3]]))
+    with pytest.raises(ValueError):
+        ds.union_many(np.array([0, 1]))
+    with pytest.raises(ValueError):
+        ds.find_many(np.array([-1]))
+
+
+def test_component_statistics(disjoint_set):
+    assert disjoint_set.num_components == 5
+    disjoint_set.union("a", "b")
+    disjoint_set.union("c", "d")
+    disjoint_set.union("b", "c")
+    disjoint_set.union("a", "d")  # Redundant
+    assert disjoint_set.num_components == 2
+    assert disjoint_set.component_size("a") == 4
+    assert disjoint_set.component_size("e") == 1
+    assert sorted(disjoint_set.members("d")) == ["a", "b", "c", "d"]
+    assert list(disjoint_set.members("e")) == ["e"]
+    with pytest.raises(ValueError):
+        disjoint_set.component_size("z")
+
+
+def test_add(disjoint_set):
+    disjoint_set.add("f")
+    disjoint_set.add("a")  # Already present
+    assert disjoint_set.num_components == 6
+    assert disjoint_set.find("f") == "f"
+    disjoint_set.union("f", "a")
+    assert sorted(disjoint_set.members("a")) == ["a", "f"]
+    assert DisjointSet([]).num_components == 0
+
+
+def test_range_add():
+    ds = DisjointSet.range(2)
+    ds.add(1)  # Already present
+    ds.add(2)
+    assert ds.num_components == 3
+    ds.union(0, 2)
+    assert sorted(ds.members(2)) == [0, 2]
+    with pytest.raises(ValueError):
+        ds.add(5)
+    with pytest.raises(ValueError):
+        ds.add("x")
+
+
+def test_range_union_many_statistics():
+    np = pytest.importorskip("numpy")
+    ds = DisjointSet.range(8)
+    ds.union(6, 7)
+    ds.union_many(np.array([[0, 4], [4, 2], [7, 5]]))
+    assert ds.num_components == 4
+    assert ds.component_size(2) == 3
+    assert sorted(ds.members(5)) == [5, 6, 7]
+    assert sorted(ds.members(0)) == [0, 2, 4]
+    assert list(ds.members(3)) == [3]
+    ds.union(3, 1)
+    assert ds.num_components == 3
+    assert sorted(ds.members(1)) == [1, 3]
+
+
+def test_parallel_components():
+    edges = [("a", "b"), ("c", "d"), ("e", "f"), ("b", "c"), ("g", "g")]
+    ds = parallel_components(edges, workers=2)
+    assert ds.num_components == 3
+    assert sorted(ds.members("a")) == ["a", "b", "c", "d"]
+    assert sorted(ds.members("e")) == ["e", "f"]
+    assert list(ds.members("g")) == ["g"]
+    assert parallel_components([], workers=2).num_components == 0
+
+
+def test_parallel_components_range():
+    edges = [(i, i + 1) for i in range(0, 98) if i % 10 != 9]
+    ds = parallel_components(edges, workers=3, n=100)
+    assert ds.num_components == 11
+    assert ds.component_size(0) == 10
+    assert ds.find(0) == ds.find(9)
+    assert ds.find(9) != ds.find(10)
+
+
+def test_parallel_components_vectorized():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(1)
+    edges = rng.integers(0, 500, size=(400, 2))
+    ds = parallel_components(edges, workers=4, n=500)
+    expected = DisjointSet.range(500)
+    expected.union_many(edges.tolist())
+    assert ds.num_components == expected.num_components
+    for u, v in edges.tolist():
+        assert ds.find(u) == ds.find(v)
+
+
+def test_rollback():
+    ds = DisjointSet(["a", "b", "c", "d", "e"], rollback=True)
+    ds.union("a", "b")
+    start = ds.checkpoint()
+    ds.union("c", "d")
+    middle = ds.checkpoint()
+    ds.union("b", "c")
+    ds.union("a", "d")  # Redundant, nothing to undo
+    assert ds.num_components == 2
+    assert ds.component_size("a") == 4
+
+    ds.rollback(middle)
+    assert ds.num_components == 3
+    assert ds.find("a") != ds.find("c")
+    assert ds.find("c") == ds.find("d")
+    assert sorted(ds.members("a")) == ["a", "b"]
+    assert sorted(ds.members("d")) == ["c", "d"]
+
+    ds.rollback(start)
+    assert ds.num_components == 4
+    assert ds.component_size("c") == 1
+    assert list(ds.members("c")) == ["c"]
+    assert ds.find("a") == ds.find("b")
+
+    ds.rollback(0)
+    assert ds.num_components == 5
+    with pytest.raises(ValueError):
+        ds.rollback(1)
+
+
+def test_rollback_range():
+    ds = DisjointSet.range(1000, rollback=True)
+    for i in range(0, 999):
+        ds.union(i, i + 1)
+    assert ds.find(0) == ds.find(999)
+    ds.rollback(500)
+    assert ds.num_components == 500
+    assert ds.find(0) == ds.find(500)
+    assert ds.find(0) != ds.find(501)
+
+
+def test_rollback_not_enabled(disjoint_set):
+    with pytest.raises(ValueError):
+        disjoint_set.checkpoint()
+    with pytest.raises(ValueError):
+        disjoint_set.rollback(0)
+
+
+def test_rollback_union_many():
+    np = pytest.importorskip("numpy")
+    ds = DisjointSet.range(4, rollback=True)
+    checkpoint = ds.checkpoint()
+    ds.union_many(np.array([[0, 1], [2, 3]]))  # Recorded like single unions
+    assert ds.num_components == 2
+    ds.rollback(checkpoint)
+    assert ds.num_components == 4
+    assert ds.find_many(np.arange(4)) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(disjoint_set, tmp_path, mmap):
+    disjoint_set.union("a", "b")
+    disjoint_set.union("c", "b")
+    path = tmp_path / "labeled.dset"
+    disjoint_set.save(path)
+
+    loaded = DisjointSet.load(path, mmap=mmap)
+    assert loaded.num_components == 3
+    assert loaded.find("a") == loaded.find("c") == disjoint_set.find("a")
+    assert loaded.find("d") == "d"
+    assert loaded.component_size("b") == 3
+    assert sorted(loaded.members("c")) == ["a", "b", "c"]
+    loaded.union("a", "c")  # Already in the same component
+    loaded.close()
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_range(tmp_path, mmap):
+    ds = DisjointSet.range(100)
+    for i in range(99):
+        if i % 10 != 9:
+            ds.union(i, i + 1)
+    path = tmp_path / "range.dset"
+    ds.save(path)
+
+    loaded = DisjointSet.load(path, mmap=mmap)
+    assert loaded.num_components == 10
+    assert [loaded.find(i) for i in range(100)] == [ds.find(i) for i in range(100)]
+    assert loaded.component_size(42) == 10
+    loaded.close()
+
+
+def test_load_mmap_read_only(disjoint_set, tmp_path):
+    path = tmp_path / "labeled.dset"
+    disjoint_set.save(path)
+    loaded = DisjointSet.load(path)
+    with pytest.raises(TypeError):
+        loaded.union("a", "b")
+    with pytest.raises(TypeError):
+        loaded.add("f")
+    loaded.close()
+
+    loaded = DisjointSet.load(path, mmap=False)
+    loaded.union("a", "b")
+    loaded.add("f")
+    assert loaded.find("a") == loaded.find("b")
+    assert loaded.num_components == 5
+
+
+def test_load_invalid(tmp_path):
+    path = tmp_path / "invalid.dset"
+    path.write_bytes(b"not a disjoint set")
+    with pytest.raises(ValueError):
+        DisjointSet.load(path)
+
+    DisjointSet.range(10).save(path)
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(ValueError):
+        DisjointSet.load(path)
+    with pytest.raises(ValueError):
+        DisjointSet.load(path, mmap=False)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("ds", [DisjointSet([]), DisjointSet.range(0)])
+def test_save_load_empty(tmp_path, ds, mmap):
+    path = tmp_path / "empty.dset"
+    ds.save(path)
+    loaded = DisjointSet.load(path, mmap=mmap)
+    assert loaded.num_components == 0
+    with pytest.raises(ValueError):
+        loaded.find(0)
+    loaded.close()
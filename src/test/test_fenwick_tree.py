@@ -1,6 +1,6 @@
 import pytest
 
-from dsa.fenwick_tree import FenwickTree
+from dsa.fenwick_tree import FenwickTree, RangeFenwickTree
 
 
 def test_fenwick_tree_initialization():
@@ -73,3 +73,74 @@ def test_single_element_array():
     ft.update(1, 8)  # Add 8 to the single element
     assert ft.prefix_sum(1) == 50
     assert ft.range_query(1, 1) == 50
+
+
+def test_construction_matches_updates():
+    array = [5, -3, 7, 0, 2, 9, -1, 4, 6, 8, -2]
+    ft = FenwickTree(array)
+
+    expected = FenwickTree([0] * len(array))
+    for i, x in enumerate(array, start=1):
+        expected.update(i, x)
+    assert ft.tree == expected.tree
+
+
+def test_from_iterable():
+    ft = FenwickTree.from_iterable(x * x for x in range(1, 6))
+    assert ft.prefix_sum(5) == 55
+    assert ft.range_query(2, 3) == 13
+
+
+def test_from_iterable_numpy():
+    np = pytest.importorskip("numpy")
+    ft = FenwickTree.from_iterable(np.full(4, 2**62, dtype=np.int64))
+    assert ft.prefix_sum(4) == 2**64
+    assert all(type(x) is int for x in ft.tree)
+
+
+def test_range_fenwick_tree_range_add():
+    array = [1, 2, 3, 4, 5]
+    ft = RangeFenwickTree(array)
+    assert ft.range_query(1, 5) == 15
+    assert ft.range_query(2, 4) == 9
+
+    # Add 10 to the 2nd through 4th elements: [1, 12, 13, 14, 5]
+    ft.range_add(2, 4, 10)
+    assert ft.prefix_sum(1) == 1
+    assert ft.prefix_sum(3) == 26
+    assert ft.range_query(4, 5) == 19
+    assert ft.range_query(1, 5) == 45
+
+    ft.range_add(1, 5, -1)
+    ft.update(5, 3)
+    assert [ft.range_query(i, i) for i in range(1, 6)] == [0, 11, 12, 13, 7]
+
+
+def test_range_fenwick_tree_matches_naive():
+    array = [(i * 7) % 11 - 5 for i in range(30)]
+    ft = RangeFenwickTree.from_iterable(iter(array))
+    for i, j, x in [(1, 30, 2), (5, 5, -7), (10, 20, 3), (29, 30, 1)]:
+        ft.range_add(i, j, x)
+        for k in range(i - 1, j):
+            array[k] += x
+    for i in range(1, 31):
+        for j in range(i, 31):
+            assert ft.range_query(i, j) == sum(array[i - 1 : j])
+
+
+def test_range_fenwick_tree_edge_cases():
+    ft = RangeFenwickTree([])
+    assert ft.prefix_sum(0) == 0
+
+    with pytest.raises(IndexError):
+        ft.range_add(1, 1, 5)
+
+    ft = RangeFenwickTree([1, 2, 3])
+    with pytest.raises(IndexError):
+        ft.range_query(0, 1)
+    with pytest.raises(IndexError):
+        ft.range_query(1, 4)
+    with pytest.raises(IndexError):
+        ft.range_query(3, 2)
+    with pytest.raises(IndexError):
+        ft.range_add(2, 4, 1)
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from dsa.skip_list import SkipList
+
+
+@pytest.fixture
+def skip_list():
+    """Fixture to create a skip list with predefined keys for testing."""
+    lst = SkipList(seed=0)
+    for key in [50, 30, 70, 20, 40, 60, 80]:
+        lst.insert(key)
+    return lst
+
+
+def assert_widths(lst: SkipList) -> None:
+    """Checks that every link width matches the distance it advances."""
+    keys = lst.inorder()
+    position = {key: i + 1 for i, key in enumerate(keys)}
+    node = lst._head
+    nodes = [(node, 0)]
+    while (node := node.next[0]) is not None:
+        nodes.append((node, position[node.key]))
+    for node, start in nodes:
+        for level, nxt in enumerate(node.next[: lst._level]):
+            end = position[nxt.key] if nxt is not None else len(keys) + 1
+            assert node.width[level] == end - start
+
+
+def test_invalid_probability():
+    with pytest.raises(ValueError):
+        SkipList(p=1)
+
+
+def test_invalid_max_level():
+    with pytest.raises(ValueError):
+        SkipList(max_level=0)
+
+    lst = SkipList(max_level=1, seed=0)
+    for key in [3, 1, 2]:
+        lst.insert(key)
+    assert lst.inorder() == [1, 2, 3]
+    assert_widths(lst)
+
+
+def test_insert_search(skip_list):
+    skip_list.insert(25)
+    skip_list.insert(25)  # Duplicate
+    assert skip_list.search(25).key == 25
+    assert skip_list.search(100) is None
+    assert skip_list.size == 8
+    assert len(skip_list) == 8
+    assert SkipList().search(1) is None
+
+
+def test_delete(skip_list):
+    skip_list.delete(20)
+    skip_list.delete(70)
+    skip_list.delete(99)  # Missing
+    assert skip_list.search(20) is None
+    assert skip_list.inorder() == [30, 40, 50, 60, 80]
+    assert_widths(skip_list)
+    for key in [30, 40, 50, 60, 80]:
+        skip_list.delete(key)
+    assert skip_list.inorder() == []
+    assert skip_list.size == 0
+
+
+def test_inorder(skip_list):
+    assert skip_list.inorder() == [20, 30, 40, 50, 60, 70, 80]
+    assert list(skip_list) == skip_list.inorder()
+    assert SkipList().inorder() == []
+
+
+def test_select_rank(skip_list):
+    assert [skip_list[k] for k in range(7)] == [20, 30, 40, 50, 60, 70, 80]
+    assert skip_list.select(3) == 50
+    with pytest.raises(IndexError):
+        skip_list.select(7)
+    assert skip_list.rank(20) == 0
+    assert skip_list.rank(55) == 4
+    assert skip_list.rank(100) == 7
+    assert SkipList().rank(1) == 0
+
+
+def test_matches_sorted_set():
+    rng = random.Random(1)
+    lst = SkipList(seed=1)
+    expected: set[int] = set()
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if rng.random() < 0.6:
+            lst.insert(key)
+            expected.add(key)
+        else:
+            lst.delete(key)
+            expected.discard(key)
+    assert_widths(lst)
+    keys = sorted(expected)
+    assert lst.inorder() == keys
+    assert [lst[k] for k in range(len(keys))] == keys
+    assert all(lst.rank(key) == k for k, key in enumerate(keys))
+
+
+def test_sorted_insert_order():
+    lst = SkipList(seed=2)
+    for key in range(10000):
+        lst.insert(key)
+    assert lst.select(1234) == 1234
+    assert lst._level < 32
+    assert_widths(lst)